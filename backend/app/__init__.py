@@ -4,13 +4,16 @@ from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
-from .config import Config
+from werkzeug.middleware.proxy_fix import ProxyFix
 import os
 from dotenv import load_dotenv
 
 # ─── Load Environment Variables ─────────────────────────────────
+# Loaded before Config so class attributes can read from os.environ
 load_dotenv()
 
+from .config import Config
+
 # ═══════════════════════════════════════════════════════════════
 # Initialize Extensions
 # ═══════════════════════════════════════════════════════════════
@@ -24,6 +27,14 @@ def create_app():
      app = Flask(__name__)
      app.config.from_object(Config)
 
+     from app.json_provider import init_json
+     init_json(app)
+
+     # ─── Reverse Proxy ───────────────────────────────────────────
+     # remote_addr must be the client, not the proxy: rate limits key on it
+     if app.config.get("PROXY_FIX_X_FOR"):
+          app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config["PROXY_FIX_X_FOR"])
+
      # ─── CORS Configuration ──────────────────────────────────────
      CORS(app,
           origins=[
@@ -43,8 +54,35 @@ def create_app():
      migrate.init_app(app, db)
      jwt.init_app(app)
 
+     from app.services.cache import response_cache
+     response_cache.init_app(app)
+
+     from app.services.single_flight import single_flight
+     single_flight.init_app(app)
+
+     from app.services.quota import quota_manager
+     quota_manager.init_app(app)
+
+     from app.services.http_client import http_client
+     http_client.init_app(app)
+
+     from app.services.async_client import async_executor
+     async_executor.init_app(app)
+
+     from app.services.password_hasher import password_hasher
+     password_hasher.init_app(app)
+
+     from app.services.activity import activity_tracker
+     activity_tracker.init_app(app)
+
+     from app.services.rate_limiter import rate_limiter
+     rate_limiter.init_app(app)
+
+     from app.response_policy import response_policy
+     response_policy.init_app(app)
+
      # ─── Import Models ───────────────────────────────────────────
-     from app.models import User, SavedItem, ShoppingListItem
+     from app.models import User, SavedItem, ShoppingListItem, ApodEntry, UserContentCount, IndexedRecipe, RecipeIngredient, UserDataVersion
 
      # ─── Register Blueprints ─────────────────────────────────────
      from app.routes.auth_routes import auth_bp
@@ -57,6 +95,8 @@ def create_app():
      from app.routes.book_routes import book_bp
      from app.routes.drink_routes import drink_bp
      from app.routes.shopping_routes import shopping_bp
+     from app.routes.admin_routes import admin_bp
+     from app.routes.dashboard_routes import dashboard_bp
 
      app.register_blueprint(auth_bp)
      app.register_blueprint(user_bp)
@@ -68,5 +108,11 @@ def create_app():
      app.register_blueprint(book_bp)
      app.register_blueprint(drink_bp)
      app.register_blueprint(shopping_bp)
+     app.register_blueprint(admin_bp)
+     app.register_blueprint(dashboard_bp)
+
+     # ─── Register CLI Commands ───────────────────────────────────
+     from app.commands import register_commands
+     register_commands(app)
 
      return app
\ No newline at end of file
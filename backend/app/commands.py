@@ -0,0 +1,147 @@
+import click
+from datetime import datetime, timedelta
+
+# ═══════════════════════════════════════════════════════════════
+# Flask CLI Commands
+# ═══════════════════════════════════════════════════════════════
+
+def register_commands(app):
+    # ═══════════════════════════════════════════════════════════════
+    # ──────────────Attach maintenance commands to `flask`───────────
+    # ═══════════════════════════════════════════════════════════════
+
+    @app.cli.command("apod-backfill")
+    @click.option("--start", required=True, help="First date to archive (YYYY-MM-DD)")
+    @click.option("--end", default=None, help="Last date to archive (YYYY-MM-DD), defaults to yesterday")
+    @click.option("--chunk-days", default=30, show_default=True, help="Days per APOD range request")
+    def apod_backfill(start, end, chunk_days):
+        """Preload the APOD archive for a date range."""
+        from app.services.nasa_api import nasa_api
+        from app.services.quota import background_priority
+
+        # ─── Parse Range ────────────────────────────────────────
+        try:
+            start_date = datetime.strptime(start, "%Y-%m-%d").date()
+            end_date = (
+                datetime.strptime(end, "%Y-%m-%d").date() if end
+                else datetime.now().date() - timedelta(days=1)
+            )
+        except ValueError:
+            raise click.BadParameter("Dates must use the YYYY-MM-DD format")
+
+        if start_date > end_date:
+            raise click.BadParameter("--start must be on or before --end")
+
+        # ─── Backfill ───────────────────────────────────────────
+        with background_priority():
+            stored = nasa_api.backfill_archive(start_date, end_date, chunk_days)
+        click.echo(f"Archived {stored} new APOD entries between {start_date} and {end_date}")
+
+    @app.cli.command("rebuild-content-counts")
+    @click.option("--user-id", type=int, default=None, help="Only rebuild counters for this user")
+    def rebuild_content_counts(user_id):
+        """Recompute the per-user content counters from saved_items."""
+        from app.models import UserContentCount
+
+        rows = UserContentCount.rebuild(user_id)
+        scope = f"user {user_id}" if user_id is not None else "all users"
+        click.echo(f"Rebuilt {rows} content counter rows for {scope}")
+
+    @app.cli.command("check-query-plans")
+    def check_query_plans():
+        """Fail if a hot query stops using an index (SQLite EXPLAIN QUERY PLAN)."""
+        from app import db
+
+        if db.engine.dialect.name != "sqlite":
+            click.echo(f"Query plan check only supports SQLite (got {db.engine.dialect.name})")
+            return
+
+        failures = 0
+        for name, query in hot_queries().items():
+            compiled = query.statement.compile(dialect=db.engine.dialect)
+            params = compiled.construct_params()
+            positional = tuple(params[key] for key in compiled.positiontup)
+
+            with db.engine.connect() as conn:
+                plan = [row[-1] for row in conn.exec_driver_sql(
+                    f"EXPLAIN QUERY PLAN {compiled}", positional
+                )]
+
+            # Full table scans and sort steps mean an index stopped covering the query
+            bad = [step for step in plan if step.startswith("SCAN ") or "TEMP B-TREE" in step]
+            status = "FAIL" if bad else "ok"
+            failures += bool(bad)
+            click.echo(f"[{status}] {name}: {' | '.join(plan)}")
+
+        if failures:
+            raise SystemExit(1)
+
+    @app.cli.command("benchmark-password-hashing")
+    @click.option("--method", default=None, help="werkzeug hash method, defaults to PASSWORD_HASH_METHOD")
+    @click.option("--logins", default=40, show_default=True, help="Password checks per run")
+    @click.option("--workers", type=int, default=None, help="Pool size, defaults to PASSWORD_HASH_WORKERS")
+    def benchmark_password_hashing(method, logins, workers):
+        """Measure password checks (logins) per second, per core and through the pool."""
+        import os
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        from app.services.password_hasher import PasswordHasher, canonical_method
+
+        method = canonical_method(method or app.config["PASSWORD_HASH_METHOD"])
+        workers = workers if workers is not None else app.config["PASSWORD_HASH_WORKERS"]
+        workers = workers or os.cpu_count() or 1
+
+        inline = PasswordHasher()
+        inline.configure(method, workers=0)
+        stored = inline.hash("benchmark-password")
+
+        # ─── Single Core (inline) ───────────────────────────────
+        started = time.perf_counter()
+        for _ in range(logins):
+            inline.verify(stored, "benchmark-password")
+        single = logins / (time.perf_counter() - started)
+        click.echo(f"{method}: {1000 / single:.1f} ms per check, {single:.1f} logins/s on one core")
+
+        # ─── Process Pool ───────────────────────────────────────
+        pooled = PasswordHasher()
+        pooled.configure(method, workers, queue_timeout=None)
+        pooled.verify(stored, "benchmark-password")  # Start the worker processes
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers * 2) as clients:
+            list(clients.map(lambda _: pooled.verify(stored, "benchmark-password"), range(logins)))
+        total = logins / (time.perf_counter() - started)
+        pooled.shutdown()
+
+        # More processes than cores just time-slice the same cores
+        cores = min(workers, os.cpu_count() or 1)
+        click.echo(
+            f"pool of {workers}: {total:.1f} logins/s, {total / cores:.1f} per core "
+            f"({os.cpu_count()} cores available)"
+        )
+
+
+def hot_queries():
+    # ═══════════════════════════════════════════════════════════════
+    # ─────Access paths the composite/expression indexes must cover──
+    # ═══════════════════════════════════════════════════════════════
+    from app import db
+    from app.models import SavedItem, ShoppingListItem, UserContentCount
+    from app.routes.content_routes import keyset_after
+
+    return {
+        "saved items by type": SavedItem.query.filter_by(user_id=1, content_type="meal")
+            .order_by(SavedItem.created_at.desc()).limit(20),
+        "saved items page": SavedItem.query.filter_by(user_id=1)
+            .order_by(SavedItem.created_at.desc()).limit(20),
+        "saved items keyset": SavedItem.query.filter_by(user_id=1)
+            .filter(keyset_after(datetime(2026, 1, 1), 100))
+            .order_by(SavedItem.created_at.desc(), SavedItem.id.desc()).limit(21),
+        "content stats": UserContentCount.query.filter_by(user_id=1),
+        "content counter rebuild": db.session.query(SavedItem.content_type, db.func.count(SavedItem.id))
+            .filter(SavedItem.user_id == 1).group_by(SavedItem.content_type),
+        "shopping duplicate check": ShoppingListItem.query.filter_by(user_id=1, section="food")
+            .filter(db.func.lower(ShoppingListItem.name) == "salt"),
+        "shopping list": ShoppingListItem.query.filter_by(user_id=1)
+            .order_by(ShoppingListItem.created_at.asc()),
+    }
@@ -1,3 +1,4 @@
+import os
 from datetime import timedelta
 
 # ═══════════════════════════════════════════════════════════════
@@ -20,4 +21,124 @@ class Config:
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=24)  # Session lasts 24 hours
     JWT_TOKEN_LOCATION = ["headers"]                 # Standard Bearer token
     JWT_HEADER_NAME = "Authorization"
-    JWT_HEADER_TYPE = "Bearer"
\ No newline at end of file
+    JWT_HEADER_TYPE = "Bearer"
+    
+    # ─── Password Hashing ───────────────────────────────────────
+    PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")  # Or e.g. "pbkdf2:sha256:1000000"
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 2))  # Hashing processes per worker (0 = inline)
+    PASSWORD_HASH_MAX_PENDING = 16                          # Hashes that may queue for a free process
+    PASSWORD_HASH_QUEUE_TIMEOUT = 5                         # Seconds to wait for a queue slot before 503
+    PASSWORD_HASH_WARM = os.getenv("PASSWORD_HASH_WARM", "true").lower() != "false"  # Start the pool at boot
+    
+    # ─── Login Activity ─────────────────────────────────────────
+    ACTIVITY_FLUSH_INTERVAL = int(os.getenv("ACTIVITY_FLUSH_INTERVAL", 30))  # Seconds between last_login writes (0 = write-through)
+    ACTIVITY_MAX_PENDING = 1000                            # Buffered users that trigger an early flush
+    
+    # ─── JSON Serialization ─────────────────────────────────────
+    JSON_PROVIDER = os.getenv("JSON_PROVIDER", "auto")    # 'auto' (orjson if installed), 'orjson' or 'default'
+    
+    # ─── Response Policy ────────────────────────────────────────
+    CACHE_CONTROL_POLICIES = {                             # By endpoint, then blueprint (200 GETs only)
+        "meal": "public, max-age=3600",
+        "drinks": "public, max-age=3600",
+        "drinks.get_random_cocktail": "no-store",
+        "books": "public, max-age=3600",
+        "nasa.get_apod": "public, max-age=900"             # Past ?date= values are immutable
+    }
+    COMPRESS_ENABLED = os.getenv("COMPRESS_ENABLED", "true").lower() != "false"
+    COMPRESS_MIN_SIZE = 1024                               # Bytes; smaller bodies are sent as-is
+    COMPRESS_GZIP_LEVEL = 6
+    COMPRESS_BROTLI_QUALITY = 5                            # Used when the brotli package is installed
+    
+    # ─── Admin Configuration ────────────────────────────────────
+    # Comma-separated user ids allowed to read /api/admin/* endpoints
+    ADMIN_USER_IDS = [
+        int(user_id) for user_id in os.getenv("ADMIN_USER_IDS", "").split(",")
+        if user_id.strip().isdigit()
+    ]
+    
+    # ─── Upstream Response Cache ────────────────────────────────
+    CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() != "false"
+    CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")  # 'memory' or 'sqlite'
+    CACHE_SQLITE_PATH = os.getenv("CACHE_SQLITE_PATH")     # Defaults to instance/upstream_cache.db
+    CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", 1024))
+    CACHE_DEFAULT_TTL = 300
+    CACHE_TTLS = {                                         # Seconds, per service namespace
+        "art": 6 * 3600,
+        "books": 6 * 3600,
+        "drinks": 6 * 3600,
+        "meals": 6 * 3600,
+        "nasa": 3600,
+        "weather": int(os.getenv("WEATHER_CACHE_TTL", 600)),
+        "weather_alias": 7 * 24 * 3600                     # Query → geo bucket mappings
+    }
+    CACHE_STALE_TTL = 24 * 3600                            # Serve-stale window past the TTL
+    CACHE_STALE_TTLS = {                                   # Per-namespace overrides
+        "weather": 1800
+    }
+    CACHE_REVALIDATE_WORKERS = 4                           # Background refresh threads
+    WEATHER_GEO_PRECISION = 1                              # Lat/lon decimals per bucket (~11 km)
+    
+    # ─── Upstream Request Coalescing ────────────────────────────
+    SINGLE_FLIGHT_ENABLED = os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() != "false"
+    SINGLE_FLIGHT_WAIT = 30                                # Seconds followers wait on the leader
+    
+    # ─── NASA Backgrounds ───────────────────────────────────────
+    NASA_BACKGROUNDS_DEADLINE = 8   # Seconds before returning partial results
+    NASA_BACKGROUNDS_WORKERS = 6    # Max concurrent per-day APOD fetches
+    NASA_RANGE_TIMEOUT = 4          # Socket timeout per range query, capped by the deadline
+    NASA_BACKFILL_TIMEOUT = 30      # Socket timeout per archive backfill chunk
+    
+    # ─── Upstream HTTP Connection Pools ─────────────────────────
+    HTTP_POOL_CONNECTIONS = 4   # Host pools kept per provider
+    HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", 10))  # Keep-alive connections per host
+    HTTP_POOL_BLOCK = True      # Wait for a free connection instead of exceeding the cap
+    HTTP_RETRIES = 2            # Connect errors and 429/5xx responses, with backoff
+    HTTP_RETRY_BACKOFF = 0.3
+    
+    # ─── Upstream Circuit Breakers ──────────────────────────────
+    CIRCUIT_BREAKER_ENABLED = os.getenv("CIRCUIT_BREAKER_ENABLED", "true").lower() != "false"
+    CIRCUIT_FAILURE_THRESHOLD = 5   # Consecutive failures before failing fast
+    CIRCUIT_RESET_TIMEOUT = 30      # Seconds before a trial call is let through
+    
+    # ─── Upstream Quotas ────────────────────────────────────────
+    QUOTA_ENABLED = os.getenv("QUOTA_ENABLED", "true").lower() != "false"
+    QUOTA_BACKEND = os.getenv("QUOTA_BACKEND", "sqlite")  # 'sqlite' (shared by workers) or 'memory'
+    QUOTA_SQLITE_PATH = os.getenv("QUOTA_SQLITE_PATH")     # Defaults to instance/upstream_quota.db
+    UPSTREAM_QUOTAS = {                                    # Token buckets per metered provider
+        "nasa": {
+            "limit": int(os.getenv("NASA_HOURLY_QUOTA", 1000)),
+            "period": 3600
+        },
+        "weather": {
+            "limit": int(os.getenv("WEATHERSTACK_MONTHLY_QUOTA", 100)),
+            "period": 30 * 24 * 3600
+        }
+    }
+    QUOTA_BACKGROUND_RESERVE = 0.25                        # Share of each bucket kept for interactive calls
+    
+    # ─── Inbound Rate Limits ────────────────────────────────────
+    RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() != "false"
+    RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")  # 'memory' or 'sqlite'
+    RATE_LIMIT_SQLITE_PATH = os.getenv("RATE_LIMIT_SQLITE_PATH")     # Defaults to instance/rate_limits.db
+    PROXY_FIX_X_FOR = int(os.getenv("PROXY_FIX_X_FOR", 1))  # Trusted X-Forwarded-For hops (Render = 1, 0 = direct)
+    RATE_LIMITS = {                                        # Requests per sliding window, by blueprint
+        "meal": {"limit": 30, "window": 60},
+        "drinks": {"limit": 30, "window": 60},
+        "books": {"limit": 30, "window": 60}
+    }
+    
+    # ─── Async Upstream Client ──────────────────────────────────
+    ASYNC_UPSTREAM_WORKERS = int(os.getenv("ASYNC_UPSTREAM_WORKERS", 32))  # Max in-flight calls per process
+    
+    # ─── Dashboard Fan-out ──────────────────────────────────────
+    DASHBOARD_TIMEOUTS = {      # Per-provider deadlines in seconds
+        "stats": 2,
+        "apod": 4,
+        "drink": 3,
+        "weather": 4,
+        "default": 5
+    }
+    
+    # ─── Saved Content ──────────────────────────────────────────
+    CONTENT_BATCH_MAX = 100     # Max items per /api/content/batch request
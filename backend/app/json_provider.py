@@ -0,0 +1,69 @@
+from flask import current_app
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # Optional speedup: pip install orjson
+    orjson = None
+
+# ═══════════════════════════════════════════════════════════════
+# JSON Serialization
+# ═══════════════════════════════════════════════════════════════
+#
+# JSON_PROVIDER = 'auto' uses orjson when it is installed and falls
+# back to Flask's stdlib provider otherwise. Types orjson does not
+# handle natively (and datetimes, so their format does not change)
+# go through Flask's default conversion.
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    # ═══════════════════════════════════════════════════════════════
+    # ─────────Flask JSON provider backed by orjson (bytes out)──────
+    # ═══════════════════════════════════════════════════════════════
+    def _options(self, sort_keys):
+        options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return options
+
+    def dumps(self, obj, **kwargs):
+        return self._dump_bytes(obj, kwargs.get('sort_keys', self.sort_keys)).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Skip the str round trip jsonify would otherwise make
+        obj = self._prepare_response_obj(args, kwargs)
+        body = self._dump_bytes(obj, self.sort_keys) + b'\n'
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+    def _dump_bytes(self, obj, sort_keys):
+        return orjson.dumps(obj, default=self.default, option=self._options(sort_keys))
+
+
+def init_json(app):
+    # ─── Install the configured provider on the app ─────────────
+    choice = app.config.get('JSON_PROVIDER', 'auto')
+    if choice == 'orjson' and orjson is None:
+        raise RuntimeError("JSON_PROVIDER is 'orjson' but orjson is not installed")
+    if choice in ('auto', 'orjson') and orjson is not None:
+        app.json = OrjsonProvider(app)
+
+
+def spliced_response(body, status=200, **fields):
+    # ═══════════════════════════════════════════════════════════════
+    # ──Prepend fields to a raw JSON object without decoding it──────
+    # ═══════════════════════════════════════════════════════════════
+    # b'{"meals": [...]}' + success=True → {"success": true, "meals": [...]}
+    prefix = current_app.json.dumps(fields).encode('utf-8')
+    rest = body.strip()[1:]
+
+    if rest.strip() == b'}':
+        payload = prefix
+    else:
+        payload = prefix[:-1] + b',' + rest
+
+    response = current_app.response_class(payload, mimetype=current_app.json.mimetype)
+    response.status_code = status
+    return response
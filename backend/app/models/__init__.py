@@ -1,9 +1,14 @@
 from .user import User
 from .saved_item import SavedItem
 from .shopping_list import ShoppingListItem
+from .apod_entry import ApodEntry
+from .content_count import UserContentCount
+from .recipe_index import IndexedRecipe, RecipeIngredient
+from .data_version import UserDataVersion
 
 # ═══════════════════════════════════════════════════════════════
 # Model Exports
 # ═══════════════════════════════════════════════════════════════
 
-__all__ = ['User', 'SavedItem', 'ShoppingListItem']
\ No newline at end of file
+__all__ = ['User', 'SavedItem', 'ShoppingListItem', 'ApodEntry', 'UserContentCount',
+           'IndexedRecipe', 'RecipeIngredient', 'UserDataVersion']
\ No newline at end of file
@@ -0,0 +1,60 @@
+from app import db
+from datetime import datetime
+from sqlalchemy.exc import IntegrityError
+
+# ═══════════════════════════════════════════════════════════════
+# ApodEntry Model
+# ═══════════════════════════════════════════════════════════════
+
+class ApodEntry(db.Model):
+    # ═══════════════════════════════════════════════════════════════
+    # ──Archived Astronomy Picture of the Day (immutable once past)───
+    # ═══════════════════════════════════════════════════════════════
+    __tablename__ = 'apod_archive'
+
+    # ─── Primary Fields ─────────────────────────────────────────
+    date       = db.Column(db.Date, primary_key=True)
+    media_type = db.Column(db.String(20), nullable=True)
+    title      = db.Column(db.String(300), nullable=True)
+    data       = db.Column(db.JSON, nullable=False)            # Full APOD payload
+    fetched_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    @classmethod
+    def store_many(cls, apods):
+        # ═══════════════════════════════════════════════════════════════
+        # ────Archive APOD payloads for past dates, skipping duplicates───
+        # ═══════════════════════════════════════════════════════════════
+        today = datetime.now().date()
+        entries = {}
+
+        for apod in apods:
+            try:
+                date = datetime.strptime(apod.get('date', ''), '%Y-%m-%d').date()
+            except ValueError:
+                continue
+            if date < today:
+                entries[date] = apod
+
+        if not entries:
+            return 0
+
+        existing = {
+            row.date for row in db.session.query(cls.date).filter(cls.date.in_(entries))
+        }
+        new_entries = [
+            cls(date=date, media_type=apod.get('media_type'), title=apod.get('title'), data=apod)
+            for date, apod in entries.items() if date not in existing
+        ]
+
+        try:
+            db.session.add_all(new_entries)
+            db.session.commit()
+        except IntegrityError:
+            # Another worker archived the same dates first
+            db.session.rollback()
+            return 0
+
+        return len(new_entries)
+
+    def __repr__(self):
+        return f'<ApodEntry {self.date}: {self.title}>'
@@ -0,0 +1,75 @@
+from app import db
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+# ═══════════════════════════════════════════════════════════════
+# UserContentCount Model
+# ═══════════════════════════════════════════════════════════════
+
+class UserContentCount(db.Model):
+    # ═══════════════════════════════════════════════════════════════
+    # ──Denormalized saved-item counts per user and content type─────
+    # ═══════════════════════════════════════════════════════════════
+    __tablename__ = 'user_content_counts'
+
+    user_id      = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    content_type = db.Column(db.String(50), primary_key=True)
+    count        = db.Column(db.Integer, nullable=False, default=0)
+
+    @classmethod
+    def adjust(cls, user_id, content_type, delta):
+        # ═══════════════════════════════════════════════════════════════
+        # ──Upsert count += delta inside the caller's open transaction───
+        # ═══════════════════════════════════════════════════════════════
+        dialect = db.session.get_bind().dialect.name
+
+        if dialect in ('sqlite', 'postgresql'):
+            insert = pg_insert if dialect == 'postgresql' else sqlite_insert
+            clamp = db.func.greatest if dialect == 'postgresql' else db.func.max
+            stmt = insert(cls).values(
+                user_id=user_id, content_type=content_type, count=max(delta, 0)
+            ).on_conflict_do_update(
+                index_elements=['user_id', 'content_type'],
+                set_={'count': clamp(cls.__table__.c.count + delta, 0)}
+            )
+            db.session.execute(stmt)
+            return
+
+        # ─── Portable Fallback ──────────────────────────────────
+        row = db.session.get(cls, (user_id, content_type))
+        if row is None:
+            db.session.add(cls(user_id=user_id, content_type=content_type, count=max(delta, 0)))
+        else:
+            row.count = max(row.count + delta, 0)
+
+    @classmethod
+    def for_user(cls, user_id):
+        # ─── {content_type: count} via primary-key prefix lookup ─
+        rows = db.session.query(cls.content_type, cls.count).filter(cls.user_id == user_id)
+        return {content_type: count for content_type, count in rows}
+
+    @classmethod
+    def rebuild(cls, user_id=None):
+        # ═══════════════════════════════════════════════════════════════
+        # ──────Recompute counts from saved_items (reconciliation)───────
+        # ═══════════════════════════════════════════════════════════════
+        from app.models.saved_item import SavedItem
+
+        source = db.select(
+            SavedItem.user_id, SavedItem.content_type, db.func.count(SavedItem.id)
+        ).group_by(SavedItem.user_id, SavedItem.content_type)
+        delete = db.delete(cls)
+
+        if user_id is not None:
+            source = source.where(SavedItem.user_id == user_id)
+            delete = delete.where(cls.user_id == user_id)
+
+        db.session.execute(delete)
+        result = db.session.execute(
+            db.insert(cls).from_select(['user_id', 'content_type', 'count'], source)
+        )
+        db.session.commit()
+        return result.rowcount
+
+    def __repr__(self):
+        return f'<UserContentCount {self.user_id}/{self.content_type}: {self.count}>'
@@ -0,0 +1,57 @@
+from app import db
+from datetime import datetime
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+# ═══════════════════════════════════════════════════════════════
+# UserDataVersion Model
+# ═══════════════════════════════════════════════════════════════
+
+class UserDataVersion(db.Model):
+    # ═══════════════════════════════════════════════════════════════
+    # ──Per-user change stamp for each data scope (ETag validators)──
+    # ═══════════════════════════════════════════════════════════════
+    __tablename__ = 'user_data_versions'
+
+    user_id    = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    scope      = db.Column(db.String(20), primary_key=True)     # 'content' or 'shopping'
+    version    = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    @classmethod
+    def bump(cls, user_id, scope):
+        # ═══════════════════════════════════════════════════════════════
+        # ─────Upsert version += 1 inside the caller's open transaction──
+        # ═══════════════════════════════════════════════════════════════
+        dialect = db.session.get_bind().dialect.name
+        now = datetime.utcnow()
+
+        if dialect in ('sqlite', 'postgresql'):
+            insert = pg_insert if dialect == 'postgresql' else sqlite_insert
+            stmt = insert(cls).values(
+                user_id=user_id, scope=scope, version=1, updated_at=now
+            ).on_conflict_do_update(
+                index_elements=['user_id', 'scope'],
+                set_={'version': cls.__table__.c.version + 1, 'updated_at': now}
+            )
+            db.session.execute(stmt)
+            return
+
+        # ─── Portable Fallback ──────────────────────────────────
+        row = db.session.get(cls, (user_id, scope))
+        if row is None:
+            db.session.add(cls(user_id=user_id, scope=scope, version=1, updated_at=now))
+        else:
+            row.version += 1
+            row.updated_at = now
+
+    @classmethod
+    def current(cls, user_id, scope):
+        # ─── (version, updated_at); (0, None) before the first write ─
+        row = db.session.query(cls.version, cls.updated_at).filter(
+            cls.user_id == user_id, cls.scope == scope
+        ).first()
+        return (row.version, row.updated_at) if row else (0, None)
+
+    def __repr__(self):
+        return f'<UserDataVersion {self.user_id}/{self.scope}: v{self.version}>'
@@ -0,0 +1,186 @@
+from app import db
+from datetime import datetime
+from flask import current_app
+from app.services.ingredients import extract_ingredients, normalize_name
+
+# ═══════════════════════════════════════════════════════════════
+# Recipe Ingredient Index Models
+# ═══════════════════════════════════════════════════════════════
+#
+# Inverted index from ingredient → meal/drink, filled in from the
+# TheMealDB / TheCocktailDB records we already fetch, so "what can I
+# make with my shopping list" never needs an upstream call.
+
+# source → (id field, name field, thumbnail field)
+RECIPE_FIELDS = {
+    'meal':  ('idMeal', 'strMeal', 'strMealThumb'),
+    'drink': ('idDrink', 'strDrink', 'strDrinkThumb')
+}
+
+class IndexedRecipe(db.Model):
+    # ═══════════════════════════════════════════════════════════════
+    # ─────────────One row per meal or drink seen upstream───────────
+    # ═══════════════════════════════════════════════════════════════
+    __tablename__ = 'indexed_recipes'
+
+    source           = db.Column(db.String(10), primary_key=True)    # 'meal' or 'drink'
+    recipe_id        = db.Column(db.String(20), primary_key=True)
+    name             = db.Column(db.String(200), nullable=False)
+    thumbnail        = db.Column(db.String(500), nullable=True)
+    ingredient_count = db.Column(db.Integer, nullable=False, default=0)
+    indexed_at       = db.Column(db.DateTime, default=datetime.utcnow)
+
+    @classmethod
+    def index_records(cls, source, records, only_new=False):
+        # ═══════════════════════════════════════════════════════════════
+        # ──Replace index rows for full upstream records, own connection──
+        # ═══════════════════════════════════════════════════════════════
+        # Runs outside db.session so indexing never commits or rolls
+        # back whatever the calling request has pending
+        id_field, name_field, thumb_field = RECIPE_FIELDS[source]
+        recipes = {}
+        ingredients = []
+
+        for record in records or []:
+            # List endpoints (filter.php) return id/name/thumb only
+            if not isinstance(record, dict) or 'strIngredient1' not in record:
+                continue
+            recipe_id = record.get(id_field)
+            names = {normalize_name(name) for name, _ in extract_ingredients(record)}
+            if not recipe_id or not names or recipe_id in recipes:
+                continue
+
+            recipes[recipe_id] = {
+                'source': source,
+                'recipe_id': recipe_id,
+                'name': record.get(name_field) or '',
+                'thumbnail': record.get(thumb_field),
+                'ingredient_count': len(names),
+                'indexed_at': datetime.utcnow()
+            }
+            ingredients.extend(
+                {'source': source, 'recipe_id': recipe_id, 'ingredient': name} for name in names
+            )
+
+        # only_new: hot paths add unseen recipes and never rewrite known ones
+        if only_new and recipes:
+            known = db.session.query(cls.recipe_id).filter(
+                cls.source == source,
+                cls.recipe_id.in_(recipes)
+            )
+            for (recipe_id,) in known:
+                recipes.pop(recipe_id, None)
+            ingredients = [row for row in ingredients if row['recipe_id'] in recipes]
+
+        if not recipes:
+            return 0
+
+        # ─── Replace Rows for These Recipes In One Transaction ──
+        with db.engine.begin() as conn:
+            conn.execute(db.delete(RecipeIngredient).where(
+                RecipeIngredient.source == source,
+                RecipeIngredient.recipe_id.in_(recipes)
+            ))
+            conn.execute(db.delete(cls).where(
+                cls.source == source,
+                cls.recipe_id.in_(recipes)
+            ))
+            conn.execute(db.insert(cls), list(recipes.values()))
+            conn.execute(db.insert(RecipeIngredient), ingredients)
+
+        return len(recipes)
+
+    @classmethod
+    def suggest(cls, have, source=None, limit=10):
+        # ═══════════════════════════════════════════════════════════════
+        # ─Rank recipes by how many of `have` (normalized names) they use─
+        # ═══════════════════════════════════════════════════════════════
+        if not have:
+            return []
+
+        matched = db.func.count(RecipeIngredient.ingredient).label('matched')
+        query = db.session.query(cls, matched).join(
+            RecipeIngredient,
+            db.and_(RecipeIngredient.source == cls.source, RecipeIngredient.recipe_id == cls.recipe_id)
+        ).filter(RecipeIngredient.ingredient.in_(have))
+
+        if source:
+            query = query.filter(RecipeIngredient.source == source)
+
+        # Most shared ingredients first, then fewest left to buy
+        ranked = query.group_by(cls.source, cls.recipe_id).order_by(
+            matched.desc(),
+            (cls.ingredient_count - matched).asc(),
+            cls.name.asc()
+        ).limit(limit).all()
+
+        if not ranked:
+            return []
+
+        # ─── Full Ingredient Lists for the Winners In One Query ──
+        keys = [(recipe.source, recipe.recipe_id) for recipe, _ in ranked]
+        rows = db.session.query(
+            RecipeIngredient.source, RecipeIngredient.recipe_id, RecipeIngredient.ingredient
+        ).filter(db.tuple_(RecipeIngredient.source, RecipeIngredient.recipe_id).in_(keys))
+
+        ingredients = {}
+        for row_source, recipe_id, ingredient in rows:
+            ingredients.setdefault((row_source, recipe_id), []).append(ingredient)
+
+        have = set(have)
+        suggestions = []
+        for recipe, count in ranked:
+            names = sorted(ingredients.get((recipe.source, recipe.recipe_id), []))
+            suggestions.append({
+                **recipe.to_dict(),
+                'matched': count,
+                'coverage': round(count / recipe.ingredient_count, 4) if recipe.ingredient_count else 0.0,
+                'have': [name for name in names if name in have],
+                'missing': [name for name in names if name not in have]
+            })
+        return suggestions
+
+    def to_dict(self):
+        return {
+            'source':          self.source,
+            'id':              self.recipe_id,
+            'name':            self.name,
+            'thumbnail':       self.thumbnail,
+            'ingredientCount': self.ingredient_count,
+        }
+
+    def __repr__(self):
+        return f'<IndexedRecipe {self.source}/{self.recipe_id}: {self.name}>'
+
+
+class RecipeIngredient(db.Model):
+    # ═══════════════════════════════════════════════════════════════
+    # ──────────Posting list entry: normalized ingredient → recipe───
+    # ═══════════════════════════════════════════════════════════════
+    __tablename__ = 'recipe_ingredients'
+
+    source     = db.Column(db.String(10), primary_key=True)
+    recipe_id  = db.Column(db.String(20), primary_key=True)
+    ingredient = db.Column(db.String(200), primary_key=True)      # normalize_name() output
+
+    __table_args__ = (
+        db.ForeignKeyConstraint(
+            ['source', 'recipe_id'],
+            ['indexed_recipes.source', 'indexed_recipes.recipe_id']
+        ),
+        # Lookup by ingredient: WHERE ingredient IN (...) [AND source]
+        db.Index('ix_recipe_ingredients_ingredient_source', 'ingredient', 'source'),
+    )
+
+    def __repr__(self):
+        return f'<RecipeIngredient {self.source}/{self.recipe_id}: {self.ingredient}>'
+
+
+def index_fetched_records(source, records, only_new=False):
+    # ─── Best-effort hook for the API services: never breaks a fetch ─
+    try:
+        return IndexedRecipe.index_records(source, records, only_new)
+    except Exception as e:
+        # Lost race with another worker, missing table, ...
+        current_app.logger.warning(f"Recipe index ({source}) skipped: {str(e)}")
+        return 0
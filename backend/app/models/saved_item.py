@@ -33,25 +33,46 @@ class SavedItem(db.Model):
     __table_args__ = (
         db.UniqueConstraint('user_id', 'external_id', 'content_type', 
                             name='unique_user_content'),
+        # Listing/stats: WHERE user_id [AND content_type] ORDER BY created_at
+        db.Index('ix_saved_items_user_type_created', 'user_id', 'content_type', 'created_at'),
+        db.Index('ix_saved_items_user_created', 'user_id', 'created_at', 'id'),
     )
     
-    def to_dict(self):
+    # ─── Serialized Field → Column (for ?fields= projection) ────
+    FIELD_COLUMNS = {
+        'id': 'id',
+        'user_id': 'user_id',
+        'category': 'category',
+        'type': 'content_type',
+        'external_id': 'external_id',
+        'title': 'title',
+        'description': 'description',
+        'user_notes': 'user_notes',
+        'metadata': 'item_metadata',
+        'createdAt': 'created_at',
+        'updatedAt': 'updated_at'
+    }
+
+    @classmethod
+    def columns_for(cls, fields):
+        # Columns to load for `fields`; id/created_at always (ordering, cursors)
+        names = {'id', 'created_at'} | {cls.FIELD_COLUMNS[field] for field in fields}
+        return [getattr(cls, name) for name in sorted(names)]
+
+    def to_dict(self, fields=None):
         # ═══════════════════════════════════════════════════════════════
         # ──Convert model instance to dictionary for JSON serialization──
         # ═══════════════════════════════════════════════════════════════
-        return {
-            'id': self.id,
-            'user_id': self.user_id,
-            'category': self.category,
-            'type': self.content_type,
-            'external_id': self.external_id,
-            'title': self.title,
-            'description': self.description,
-            'user_notes': self.user_notes,
-            'metadata': self.item_metadata if self.item_metadata else {},
-            'createdAt': self.created_at.isoformat() if self.created_at else None,
-            'updatedAt': self.updated_at.isoformat() if self.updated_at else None
-        }
+        # `fields` limits the output (and the attributes touched) to a subset
+        return {field: self._field(field) for field in (fields or self.FIELD_COLUMNS)}
+
+    def _field(self, field):
+        if field == 'metadata':
+            return self.item_metadata if self.item_metadata else {}
+        if field in ('createdAt', 'updatedAt'):
+            value = getattr(self, self.FIELD_COLUMNS[field])
+            return value.isoformat() if value else None
+        return getattr(self, self.FIELD_COLUMNS[field])
     
     def __repr__(self):
         return f'<SavedItem {self.id}: {self.title}>'
\ No newline at end of file
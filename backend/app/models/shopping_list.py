@@ -27,4 +27,14 @@ class ShoppingListItem(db.Model):
         }
 
     def __repr__(self):
-        return f'<ShoppingListItem {self.id}: {self.name}>'
\ No newline at end of file
+        return f'<ShoppingListItem {self.id}: {self.name}>'
+
+# ─── Indexes ───────────────────────────────────────────────────
+# Case-insensitive duplicate check: WHERE user_id, section, lower(name)
+db.Index(
+    'ix_shopping_list_items_user_section_name',
+    ShoppingListItem.user_id,
+    ShoppingListItem.section,
+    db.func.lower(ShoppingListItem.name)
+)
+db.Index('ix_shopping_list_items_user_created', ShoppingListItem.user_id, ShoppingListItem.created_at)
@@ -25,7 +25,7 @@ class User(db.Model):
     
     # ─── Timestamps ─────────────────────────────────────────────
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    last_login = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    last_login = db.Column(db.DateTime, default=datetime.utcnow)     # Written in batches by the activity tracker
     
     # ─── Relationships ──────────────────────────────────────────
     saved_items = db.relationship('SavedItem', backref='user', lazy=True, cascade='all, delete-orphan')
@@ -0,0 +1,134 @@
+import gzip
+from datetime import datetime
+from flask import g, has_app_context, request
+
+try:
+    import brotli
+except ImportError:  # Optional: pip install brotli
+    brotli = None
+
+# ═══════════════════════════════════════════════════════════════
+# Response Policy Layer
+# ═══════════════════════════════════════════════════════════════
+#
+# One after_request hook for cross-cutting response concerns:
+#   • Cache-Control for public proxy routes, looked up by endpoint
+#     then blueprint in CACHE_CONTROL_POLICIES (past APOD dates never
+#     change, so they are marked immutable). Responses built from a
+#     fallback after an upstream failure (mark_degraded) get no-store
+#     instead, so shared caches never pin mock or empty payloads
+#   • br/gzip compression of text/JSON bodies above COMPRESS_MIN_SIZE,
+#     negotiated from Accept-Encoding (brotli only when installed)
+
+COMPRESSIBLE_TYPES = frozenset([
+    'application/json', 'text/html', 'text/plain', 'text/css', 'application/javascript'
+])
+
+IMMUTABLE = 'public, max-age=31536000, immutable'
+DEGRADED = 'no-store'
+
+
+def mark_degraded():
+    # ─── Called by service fallbacks: this response is not real data ─
+    # An app context is enough: async executor calls copy it back
+    if has_app_context():
+        g.degraded = True
+
+
+class ResponsePolicy:
+    # ═══════════════════════════════════════════════════════════════
+    # ─────────Cache headers and compression for every response──────
+    # ═══════════════════════════════════════════════════════════════
+    def __init__(self):
+        self.policies = {}
+        self.compress_enabled = True
+        self.compress_min_size = 1024
+        self.gzip_level = 6
+        self.brotli_quality = 5
+
+    def init_app(self, app):
+        self.policies = dict(app.config.get('CACHE_CONTROL_POLICIES', {}))
+        self.compress_enabled = app.config.get('COMPRESS_ENABLED', self.compress_enabled)
+        self.compress_min_size = app.config.get('COMPRESS_MIN_SIZE', self.compress_min_size)
+        self.gzip_level = app.config.get('COMPRESS_GZIP_LEVEL', self.gzip_level)
+        self.brotli_quality = app.config.get('COMPRESS_BROTLI_QUALITY', self.brotli_quality)
+
+        app.after_request(self.apply)
+        app.extensions['response_policy'] = self
+
+    def apply(self, response):
+        self.set_cache_control(response)
+        if self.compress_enabled:
+            self.compress(response)
+        return response
+
+    # ─── Cache-Control ────────────────────────────────────────
+
+    def cache_policy(self):
+        # Endpoint-specific policy first, then the blueprint default
+        endpoint = request.endpoint or ''
+        if endpoint == 'nasa.get_apod' and is_past_date(request.args.get('date')):
+            return IMMUTABLE
+        return self.policies.get(endpoint, self.policies.get(request.blueprint))
+
+    def set_cache_control(self, response):
+        # Only successful reads; views that set their own header win
+        if request.method not in ('GET', 'HEAD') or response.status_code != 200:
+            return
+        if 'Cache-Control' in response.headers:
+            return
+
+        policy = DEGRADED if g.get('degraded') else self.cache_policy()
+        if policy:
+            response.headers['Cache-Control'] = policy
+
+    # ─── Compression ──────────────────────────────────────────
+
+    def compress(self, response):
+        if response.mimetype not in COMPRESSIBLE_TYPES:
+            return
+        response.vary.add('Accept-Encoding')
+
+        if (response.direct_passthrough or response.is_streamed
+                or response.status_code < 200 or response.status_code in (204, 304)
+                or 'Content-Encoding' in response.headers):
+            return
+
+        encoding = self.choose_encoding()
+        if encoding is None:
+            return
+
+        body = response.get_data()
+        if len(body) < self.compress_min_size:
+            return
+
+        if encoding == 'br':
+            compressed = brotli.compress(body, quality=self.brotli_quality)
+        else:
+            compressed = gzip.compress(body, compresslevel=self.gzip_level)
+
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+
+    def choose_encoding(self):
+        # Client preference by q-value; brotli wins ties when available
+        accepted = request.accept_encodings
+        candidates = (['br'] if brotli is not None else []) + ['gzip']
+        scored = [(accepted.quality(name), name) for name in candidates]
+        scored = [(quality, name) for quality, name in scored if quality > 0]
+        if not scored:
+            return None
+        best = max(quality for quality, _ in scored)
+        return next(name for quality, name in scored if quality == best)
+
+
+def is_past_date(value):
+    # "YYYY-MM-DD" strictly before today; anything else is not immutable
+    try:
+        return datetime.strptime(value or '', '%Y-%m-%d').date() < datetime.now().date()
+    except ValueError:
+        return False
+
+
+# ─── Singleton Instance ────────────────────────────────────────
+response_policy = ResponsePolicy()
@@ -0,0 +1,79 @@
+from functools import wraps
+from flask import Blueprint, jsonify, current_app
+from flask_jwt_extended import jwt_required
+from app.services.cache import response_cache
+from app.services.http_client import http_client
+from app.services.identity import current_user_id
+from app.services.quota import quota_manager
+from app.services.single_flight import single_flight
+
+# ═══════════════════════════════════════════════════════════════
+# Admin Routes (Operational Metrics)
+# ═══════════════════════════════════════════════════════════════
+
+admin_bp = Blueprint("admin", __name__, url_prefix="/api/admin")
+
+# ─── Helper Functions ──────────────────────────────────────────
+
+def admin_required(fn):
+    # ═══════════════════════════════════════════════════════════════
+    # ──────Restrict a route to user ids listed in ADMIN_USER_IDS────
+    # ═══════════════════════════════════════════════════════════════
+    @wraps(fn)
+    @jwt_required()
+    def wrapper(*args, **kwargs):
+        if current_user_id() not in current_app.config.get('ADMIN_USER_IDS', []):
+            return jsonify({
+                "success": False,
+                "error": "forbidden",
+                "message": "Admin access required"
+            }), 403
+        return fn(*args, **kwargs)
+
+    return wrapper
+
+# ─── Routes ───────────────────────────────────────────────────
+
+@admin_bp.route("/cache", methods=["GET"])
+@admin_required
+def cache_stats():
+    # ═══════════════════════════════════════════════════════════════
+    # ─────Hit/miss/eviction counters for the upstream response cache─
+    # ═══════════════════════════════════════════════════════════════
+    return jsonify({
+        "success": True,
+        "cache": response_cache.stats()
+    }), 200
+
+@admin_bp.route("/single-flight", methods=["GET"])
+@admin_required
+def single_flight_stats():
+    # ═══════════════════════════════════════════════════════════════
+    # ────Upstream calls made vs. identical calls collapsed into them─
+    # ═══════════════════════════════════════════════════════════════
+    return jsonify({
+        "success": True,
+        "single_flight": single_flight.stats()
+    }), 200
+
+@admin_bp.route("/http", methods=["GET"])
+@admin_required
+def http_stats():
+    # ═══════════════════════════════════════════════════════════════
+    # ──────Keep-alive connection reuse for upstream providers───────
+    # ═══════════════════════════════════════════════════════════════
+    return jsonify({
+        "success": True,
+        "http": http_client.stats()
+    }), 200
+
+@admin_bp.route("/quotas", methods=["GET"])
+@admin_required
+def quota_stats():
+    # ═══════════════════════════════════════════════════════════════
+    # ──────Remaining upstream call budget per metered provider──────
+    # ═══════════════════════════════════════════════════════════════
+    return jsonify({
+        "success": True,
+        "quotas": quota_manager.stats()
+    }), 200
@@ -1,6 +1,6 @@
 from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required
-from app.services.art_api import art_api
+from app.services.art_api import async_art_api
 
 # ═══════════════════════════════════════════════════════════════
 # Art Routes
@@ -10,7 +10,7 @@ art_bp = Blueprint("art", __name__, url_prefix="/art")
 
 @art_bp.route("/search", methods=["GET"])
 @jwt_required()
-def search_art():
+async def search_art():
     # ═══════════════════════════════════════════════════════════════
     # ───Search for artworks from the Art Institute of Chicago API───
     # ═══════════════════════════════════════════════════════════════
@@ -28,7 +28,7 @@ def search_art():
     
     # ─── Fetch Data ─────────────────────────────────────────────
     try:
-        art_data = art_api.search_artworks(query)
+        art_data = await async_art_api.search_artworks(query)
         
         return jsonify({
             "success": True,
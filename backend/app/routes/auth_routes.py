@@ -1,7 +1,9 @@
 from flask import Blueprint, request, jsonify, current_app
-from werkzeug.security import generate_password_hash, check_password_hash
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
-from app.models import User, SavedItem
+from app.models import User, SavedItem, ShoppingListItem, UserContentCount, UserDataVersion
+from app.services.activity import activity_tracker
+from app.services.identity import current_user_id
+from app.services.password_hasher import password_hasher, HasherBusyError
 from app import db
 from datetime import datetime
 
@@ -37,7 +39,7 @@ def register():
     
     # ─── Create User ────────────────────────────────────────────
     try:
-        hashed_pw = generate_password_hash(data["password"])
+        hashed_pw = password_hasher.hash(data["password"])
         
         user = User(
             email=data["email"],
@@ -60,6 +62,10 @@ def register():
             "user": user.to_dict()
         }), 201
         
+    except HasherBusyError:
+        db.session.rollback()
+        return hasher_busy_response()
+
     except Exception as e:
         db.session.rollback()
         current_app.logger.error(f"Registration error: {str(e)}")
@@ -87,24 +93,42 @@ def login():
     # ─── Authenticate ───────────────────────────────────────────
     user = User.query.filter_by(email=data["email"]).first()
     
-    if not user or not check_password_hash(user.password_hash, data["password"]):
+    try:
+        valid = bool(user) and password_hasher.verify(user.password_hash, data["password"])
+    except HasherBusyError:
+        return hasher_busy_response()
+    
+    if not valid:
         return jsonify({
             "success": False,
             "error": "invalid_credentials",
             "message": "Invalid email or password"
         }), 401
     
-    # ─── Update Last Login ──────────────────────────────────────
-    user.last_login = datetime.utcnow()
-    db.session.commit()
+    # ─── Upgrade Outdated Hash ──────────────────────────────────
+    # The plaintext is only available here, so old method/cost
+    # hashes are replaced on the next successful login
+    if password_hasher.needs_rehash(user.password_hash):
+        try:
+            user.password_hash = password_hasher.hash(data["password"])
+            db.session.commit()
+        except HasherBusyError:
+            pass  # Keep the old hash; retried on a later login
+    
+    # ─── Record Last Login ──────────────────────────────────────
+    # Buffered and written in batches, not as an UPDATE per login
+    last_login = activity_tracker.record_login(user.id)
     
     # ─── Generate Token ─────────────────────────────────────────
     token = create_access_token(identity=str(user.id))
     
+    user_data = user.to_dict()
+    user_data["lastLogin"] = last_login.isoformat()
+    
     return jsonify({
         "success": True,
         "access_token": token,
-        "user": user.to_dict()
+        "user": user_data
     }), 200
     
 @auth_bp.route("/check-token", methods=["GET"])
@@ -134,22 +158,24 @@ def delete_account():
     # ═══════════════════════════════════════════════════════════════
     # ────Permanently delete user account and all associated data────
     # ═══════════════════════════════════════════════════════════════
-    # ─── Get User ───────────────────────────────────────────────
-    user_id = get_jwt_identity()
+    user_id = current_user_id()
     
     try:
-        user = User.query.get(user_id)
+        # ─── Delete All User Data ────────────────────────────────
+        # Bulk statements by user_id: nothing is loaded row by row
+        for model in (SavedItem, ShoppingListItem, UserContentCount, UserDataVersion):
+            model.query.filter_by(user_id=user_id).delete(synchronize_session=False)
+        
+        deleted = User.query.filter_by(id=user_id).delete(synchronize_session=False)
         
-        if not user:
+        if not deleted:
+            db.session.rollback()
             return jsonify({
                 "success": False,
                 "error": "user_not_found",
                 "message": "User not found"
             }), 404
         
-        # ─── Delete All User Data ────────────────────────────────
-        # Saved items cascade automatically due to relationship
-        db.session.delete(user)
         db.session.commit()
         
         return jsonify({
@@ -164,4 +190,16 @@ def delete_account():
             "success": False,
             "error": "delete_failed",
             "message": "Failed to delete account. Please try again."
-        }), 500
\ No newline at end of file
+        }), 500
+
+
+def hasher_busy_response():
+    # ─── 503 while every hashing process is busy ────────────────
+    response = jsonify({
+        "success": False,
+        "error": "server_busy",
+        "message": "Too many sign-in attempts right now. Please try again shortly."
+    })
+    response.status_code = 503
+    response.headers['Retry-After'] = '1'
+    return response
@@ -1,5 +1,5 @@
 from flask import Blueprint, request, jsonify, current_app
-from app.services.book_api import book_api
+from app.services.book_api import book_api, async_book_api
 
 # ═══════════════════════════════════════════════════════════════
 # Book Routes
@@ -8,7 +8,7 @@ from app.services.book_api import book_api
 book_bp = Blueprint('books', __name__, url_prefix='/api/books')
 
 @book_bp.route('/search', methods=['GET'])
-def search_books():
+async def search_books():
     # ═══════════════════════════════════════════════════════════════
     # ───────────Search for books using Open Library API─────────────
     # ═══════════════════════════════════════════════════════════════    
@@ -26,7 +26,7 @@ def search_books():
     # ─── Fetch Data ─────────────────────────────────────────────
     try:
         limit = request.args.get('limit', 20, type=int)
-        results = book_api.search_books(query, limit)
+        results = await async_book_api.search_books(query, limit)
         
         return jsonify({
             "success": True,
@@ -1,9 +1,17 @@
 from flask import Blueprint, request, jsonify, current_app
-from flask_jwt_extended import jwt_required, get_jwt_identity
-from app.models import SavedItem
+from flask_jwt_extended import jwt_required
+from app.models import SavedItem, UserContentCount, UserDataVersion
+from app.services.conditional import conditional_get
+from app.services.content_search import search_items
+from app.services.identity import current_user_id, owned
 from app import db
 from datetime import datetime
-from sqlalchemy import func
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import load_only
+from collections import Counter
+import base64
+import json
 
 # ═══════════════════════════════════════════════════════════════
 # Content Routes (Saved Items)
@@ -17,15 +25,8 @@ def get_content_stats(user_id):
     # ═══════════════════════════════════════════════════════════════
     # ─────────Generate statistics about user's saved content────────
     # ═══════════════════════════════════════════════════════════════    
-    # Query counts grouped by content_type
-    stats = db.session.query(
-        SavedItem.content_type,
-        func.count(SavedItem.id).label('count')
-    ).filter(
-        SavedItem.user_id == user_id
-    ).group_by(
-        SavedItem.content_type
-    ).all()
+    # Read the incrementally maintained per-type counters
+    stats = UserContentCount.for_user(user_id).items()
 
     # Initialize with zeros
     formatted_stats = {
@@ -58,16 +59,54 @@ def get_content_stats(user_id):
     
     return formatted_stats
 
+def encode_cursor(item):
+    # ─── Opaque Keyset Cursor: (created_at, id) of the last row ──
+    raw = json.dumps([item.created_at.isoformat(), item.id])
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+def decode_cursor(cursor):
+    # Raises ValueError for malformed cursors
+    try:
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return datetime.fromisoformat(created_at), int(item_id)
+    except (TypeError, ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+def parse_fields(value):
+    # ─── ?fields=title,type → ['title', 'type']; None = all fields ─
+    # Raises ValueError for unknown field names
+    if not value:
+        return None
+    fields = [field.strip() for field in value.split(',') if field.strip()]
+    unknown = [field for field in fields if field not in SavedItem.FIELD_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return fields or None
+
+def normalize_external_id(value):
+    # ─── Ids are stored as strings: JSON 52772 and "52772" match ─
+    if value is None or value == '':
+        return None
+    return str(value)
+
+def keyset_after(created_at, item_id):
+    # ─── Rows after the cursor in (created_at DESC, id DESC) order ─
+    return or_(
+        SavedItem.created_at < created_at,
+        and_(SavedItem.created_at == created_at, SavedItem.id < item_id)
+    )
+
 # ─── Routes ───────────────────────────────────────────────────
 
 @content_bp.route("/stats", methods=["GET"])
 @jwt_required()
+@conditional_get('content')
 def get_dashboard_stats():
     # ═══════════════════════════════════════════════════════════════
     # ────Get statistics about user's saved content for dashboard────
     # ═══════════════════════════════════════════════════════════════    
     try:
-        user_id = int(get_jwt_identity())
+        user_id = current_user_id()
         stats = get_content_stats(user_id)
         
         return jsonify({
@@ -90,7 +129,7 @@ def create_item():
     # ──────────────Save a new item to user's collection─────────────
     # ═══════════════════════════════════════════════════════════════    
     try:
-        user_id = int(get_jwt_identity())
+        user_id = current_user_id()
         data = request.get_json()
 
         # ─── Validate Required Fields ───────────────────────────
@@ -136,6 +175,8 @@ def create_item():
         )
         
         db.session.add(item)
+        UserContentCount.adjust(user_id, content_type, 1)
+        UserDataVersion.bump(user_id, 'content')
         db.session.commit()
         
         return jsonify({
@@ -154,25 +195,45 @@ def create_item():
 
 @content_bp.route("/", methods=["GET"])
 @jwt_required()
+@conditional_get('content')
 def get_items():
     # ═══════════════════════════════════════════════════════════════
     # ────────────Get user's saved items with pagination─────────────
     # ═══════════════════════════════════════════════════════════════    
     try:
-        user_id = int(get_jwt_identity())
+        user_id = current_user_id()
 
         # ─── Parse Query Parameters ─────────────────────────────
         content_type = request.args.get('type')
         limit = min(int(request.args.get('limit', 20)), 50)
-        page = int(request.args.get('page', 1))
-        offset = (page - 1) * limit
+        cursor = request.args.get('cursor')
+
+        try:
+            fields = parse_fields(request.args.get('fields'))
+        except ValueError as e:
+            return jsonify({
+                "success": False,
+                "error": "invalid_fields",
+                "message": str(e)
+            }), 400
 
         # ─── Build Query ────────────────────────────────────────
         query = SavedItem.query.filter_by(user_id=user_id)
+
+        # Projection: only SELECT the columns behind the requested fields
+        if fields:
+            query = query.options(load_only(*SavedItem.columns_for(fields)))
         
         if content_type:
             query = query.filter_by(content_type=content_type)
 
+        # ─── Cursor Mode (?cursor= for the first page) ──────────
+        if cursor is not None:
+            return get_items_page(query, cursor, limit, user_id, content_type, fields)
+
+        page = int(request.args.get('page', 1))
+        offset = (page - 1) * limit
+
         # ─── Get Results ────────────────────────────────────────
         total = query.count()
         items = query.order_by(
@@ -182,7 +243,7 @@ def get_items():
         # ─── Format Response ────────────────────────────────────
         return jsonify({
             "success": True,
-            "content": [item.to_dict() for item in items],
+            "content": [item.to_dict(fields) for item in items],
             "pagination": {
                 "currentPage": page,
                 "totalPages": (total + limit - 1) // limit,
@@ -200,6 +261,97 @@ def get_items():
             "message": "Failed to fetch saved items"
         }), 500
 
+def get_items_page(query, cursor, limit, user_id, content_type, fields=None):
+    # ═══════════════════════════════════════════════════════════════
+    # ──Keyset pagination: one O(page size) query, count on request──
+    # ═══════════════════════════════════════════════════════════════
+    if cursor:
+        try:
+            created_at, item_id = decode_cursor(cursor)
+        except ValueError:
+            return jsonify({
+                "success": False,
+                "error": "invalid_cursor",
+                "message": "Pagination cursor is invalid"
+            }), 400
+        page_query = query.filter(keyset_after(created_at, item_id))
+    else:
+        page_query = query
+
+    # Fetch one extra row to learn whether another page exists
+    items = page_query.order_by(
+        SavedItem.created_at.desc(),
+        SavedItem.id.desc()
+    ).limit(limit + 1).all()
+
+    has_next = len(items) > limit
+    items = items[:limit]
+
+    pagination = {
+        "limit": limit,
+        "nextCursor": encode_cursor(items[-1]) if has_next else None,
+        "hasNextPage": has_next,
+        "hasPreviousPage": bool(cursor)
+    }
+
+    # ─── Optional Total (served from the per-type counters) ─────
+    if request.args.get('include_total', 'false').lower() == 'true':
+        counts = UserContentCount.for_user(user_id)
+        pagination["totalItems"] = counts.get(content_type, 0) if content_type else sum(counts.values())
+
+    return jsonify({
+        "success": True,
+        "content": [item.to_dict(fields) for item in items],
+        "pagination": pagination
+    }), 200
+
+@content_bp.route("/search", methods=["GET"])
+@jwt_required()
+def search_content():
+    # ═══════════════════════════════════════════════════════════════
+    # ────────Full-text search over the user's saved items───────────
+    # ═══════════════════════════════════════════════════════════════
+    try:
+        user_id = current_user_id()
+
+        # ─── Parse Query Parameters ─────────────────────────────
+        query_text = request.args.get('q', '').strip()
+        content_type = request.args.get('type')
+        limit = min(int(request.args.get('limit', 20)), 50)
+
+        if not query_text:
+            return jsonify({
+                "success": False,
+                "error": "missing_query",
+                "message": "Search query 'q' is required"
+            }), 400
+
+        # ─── Rank Matches, Then Load Them In One Query ──────────
+        ranked = search_items(user_id, query_text, content_type, limit)
+        items = {
+            item.id: item for item in
+            SavedItem.query.filter(SavedItem.id.in_([item_id for item_id, _ in ranked]))
+        } if ranked else {}
+
+        results = []
+        for item_id, rank in ranked:
+            if item_id in items:
+                results.append({**items[item_id].to_dict(), "rank": rank})
+
+        return jsonify({
+            "success": True,
+            "query": query_text,
+            "content": results
+        }), 200
+
+    except Exception as e:
+        current_app.logger.error(f"Search items error: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": "search_failed",
+            "message": "Failed to search saved items"
+        }), 500
+
 @content_bp.route("/<int:item_id>", methods=["PUT"])
 @jwt_required()
 def update_item(item_id):
@@ -207,17 +359,18 @@ def update_item(item_id):
     # ───────Update user notes or metadata for a saved item──────────
     # ═══════════════════════════════════════════════════════════════    
     try:
-        user_id = int(get_jwt_identity())
+        user_id = current_user_id()
         
-        # ─── Find Item ──────────────────────────────────────────
-        item = SavedItem.query.get_or_404(item_id)
+        # ─── Find Owned Item ────────────────────────────────────
+        # Another user's item is indistinguishable from a missing one
+        item = owned(SavedItem, item_id)
         
-        if item.user_id != user_id:
+        if item is None:
             return jsonify({
                 "success": False,
-                "error": "unauthorized",
-                "message": "You don't have permission to update this item"
-            }), 403
+                "error": "not_found",
+                "message": "Item not found"
+            }), 404
         
         # ─── Update Fields ──────────────────────────────────────
         data = request.get_json()
@@ -231,6 +384,7 @@ def update_item(item_id):
             item.item_metadata = current_metadata
         
         item.updated_at = datetime.utcnow()
+        UserDataVersion.bump(user_id, 'content')
         db.session.commit()
         
         return jsonify({
@@ -254,20 +408,22 @@ def delete_item(item_id):
     # ──────────────────────Delete a saved item──────────────────────
     # ═══════════════════════════════════════════════════════════════    
     try:
-        user_id = int(get_jwt_identity())
+        user_id = current_user_id()
         
-        # ─── Find Item ──────────────────────────────────────────
-        item = SavedItem.query.get_or_404(item_id)
+        # ─── Find Owned Item ────────────────────────────────────
+        item = owned(SavedItem, item_id)
         
-        if item.user_id != user_id:
+        if item is None:
             return jsonify({
                 "success": False,
-                "error": "unauthorized",
-                "message": "You don't have permission to delete this item"
-            }), 403
+                "error": "not_found",
+                "message": "Item not found"
+            }), 404
         
         # ─── Delete ─────────────────────────────────────────────
         db.session.delete(item)
+        UserContentCount.adjust(user_id, item.content_type, -1)
+        UserDataVersion.bump(user_id, 'content')
         db.session.commit()
         
         return jsonify({
@@ -282,4 +438,191 @@ def delete_item(item_id):
             "success": False,
             "error": "delete_failed",
             "message": "Failed to delete item"
-        }), 500
\ No newline at end of file
+        }), 500
+
+@content_bp.route("/batch", methods=["POST"])
+@jwt_required()
+def create_items_batch():
+    # ═══════════════════════════════════════════════════════════════
+    # ──Save many items: one duplicate lookup, one commit, per-item status─
+    # ═══════════════════════════════════════════════════════════════
+    try:
+        user_id = current_user_id()
+        data = request.get_json() or {}
+        items_data = data.get('items')
+        max_items = current_app.config.get('CONTENT_BATCH_MAX', 100)
+
+        if not isinstance(items_data, list) or not items_data:
+            return jsonify({
+                "success": False,
+                "error": "missing_fields",
+                "message": "Request body must include a non-empty 'items' array"
+            }), 400
+
+        if len(items_data) > max_items:
+            return jsonify({
+                "success": False,
+                "error": "batch_too_large",
+                "message": f"A batch may contain at most {max_items} items"
+            }), 400
+
+        # ─── Resolve Existing Duplicates In One Query ───────────
+        external_ids = {
+            normalize_external_id(entry.get('external_id')) for entry in items_data
+            if isinstance(entry, dict)
+        }
+        external_ids.discard(None)
+        existing = {}
+        if external_ids:
+            rows = db.session.query(
+                SavedItem.id, SavedItem.external_id, SavedItem.content_type
+            ).filter(
+                SavedItem.user_id == user_id,
+                SavedItem.external_id.in_(external_ids)
+            )
+            existing = {(external_id, content_type): item_id for item_id, external_id, content_type in rows}
+
+        # ─── Build Rows and Per-item Results ────────────────────
+        required_fields = ['category', 'type', 'title']
+        results = []
+        created = []
+        batch_keys = set()
+        type_counts = Counter()
+
+        for index, entry in enumerate(items_data):
+            if not isinstance(entry, dict):
+                results.append({"index": index, "status": "invalid", "message": "Item must be an object"})
+                continue
+
+            missing = [field for field in required_fields if field not in entry]
+            if missing:
+                results.append({
+                    "index": index,
+                    "status": "invalid",
+                    "message": f"Missing required fields: {', '.join(missing)}"
+                })
+                continue
+
+            external_id = normalize_external_id(entry.get('external_id'))
+            key = (external_id, entry['type'])
+            if external_id and key in existing:
+                results.append({"index": index, "status": "duplicate", "id": existing[key]})
+                continue
+            if external_id and key in batch_keys:
+                results.append({"index": index, "status": "duplicate", "message": "Repeated within this batch"})
+                continue
+
+            item = SavedItem(
+                user_id=user_id,
+                category=entry['category'],
+                content_type=entry['type'],
+                external_id=external_id,
+                title=entry['title'],
+                description=entry.get('description'),
+                user_notes=entry.get('user_notes', ''),
+                item_metadata=entry.get('metadata', {})
+            )
+            if external_id:
+                batch_keys.add(key)
+            created.append((index, item))
+            results.append(None)
+
+        # ─── Insert All and Commit Once ─────────────────────────
+        try:
+            with db.session.begin_nested():
+                db.session.add_all([item for _, item in created])
+        except IntegrityError:
+            # A concurrent request saved one of these first: retry row by
+            # row so only the raced items are reported as duplicates
+            inserted = []
+            for index, item in created:
+                item = SavedItem(**{
+                    column: getattr(item, column) for column in (
+                        'user_id', 'category', 'content_type', 'external_id',
+                        'title', 'description', 'user_notes', 'item_metadata'
+                    )
+                })
+                try:
+                    with db.session.begin_nested():
+                        db.session.add(item)
+                    inserted.append((index, item))
+                except IntegrityError:
+                    results[index] = {"index": index, "status": "duplicate", "message": "Saved concurrently"}
+            created = inserted
+
+        for index, item in created:
+            type_counts[item.content_type] += 1
+            results[index] = {"index": index, "status": "created", "content": item.to_dict()}
+        for content_type, count in type_counts.items():
+            UserContentCount.adjust(user_id, content_type, count)
+        if created:
+            UserDataVersion.bump(user_id, 'content')
+        db.session.commit()
+
+        return jsonify({
+            "success": True,
+            "created": len(created),
+            "results": results
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Batch create error: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": "create_failed",
+            "message": "Failed to save items"
+        }), 500
+
+@content_bp.route("/batch", methods=["DELETE"])
+@jwt_required()
+def delete_items_batch():
+    # ═══════════════════════════════════════════════════════════════
+    # ────────Delete many saved items with a single statement────────
+    # ═══════════════════════════════════════════════════════════════
+    try:
+        user_id = current_user_id()
+        data = request.get_json() or {}
+        ids = data.get('ids')
+
+        if not isinstance(ids, list) or not ids or not all(isinstance(item_id, int) for item_id in ids):
+            return jsonify({
+                "success": False,
+                "error": "missing_fields",
+                "message": "Request body must include a non-empty 'ids' array of integers"
+            }), 400
+
+        # ─── Find Owned Items (types needed for counters) ───────
+        owned_by_id = dict(db.session.query(SavedItem.id, SavedItem.content_type).filter(
+            SavedItem.user_id == user_id,
+            SavedItem.id.in_(ids)
+        ).all())
+
+        # ─── Delete and Commit Once ─────────────────────────────
+        if owned_by_id:
+            SavedItem.query.filter(
+                SavedItem.user_id == user_id,
+                SavedItem.id.in_(owned_by_id)
+            ).delete(synchronize_session=False)
+            for content_type, count in Counter(owned_by_id.values()).items():
+                UserContentCount.adjust(user_id, content_type, -count)
+            UserDataVersion.bump(user_id, 'content')
+            db.session.commit()
+
+        return jsonify({
+            "success": True,
+            "deleted": len(owned_by_id),
+            "results": [
+                {"id": item_id, "status": "deleted" if item_id in owned_by_id else "not_found"}
+                for item_id in ids
+            ]
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Batch delete error: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": "delete_failed",
+            "message": "Failed to delete items"
+        }), 500
@@ -0,0 +1,92 @@
+import asyncio
+import time
+from flask import Blueprint, request, jsonify, current_app
+from flask_jwt_extended import jwt_required
+from app.routes.content_routes import get_content_stats
+from app.services.async_client import async_executor
+from app.services.drink_api import drink_api
+from app.services.identity import current_user_id
+from app.services.nasa_api import nasa_api
+from app.services.weather_api import weather_api
+
+# ═══════════════════════════════════════════════════════════════
+# Dashboard Routes (Aggregated Fan-out)
+# ═══════════════════════════════════════════════════════════════
+
+dashboard_bp = Blueprint("dashboard", __name__, url_prefix="/api/dashboard")
+
+# ─── Helper Functions ──────────────────────────────────────────
+
+async def settle(name, future, timeout, key):
+    # ═══════════════════════════════════════════════════════════════
+    # ──Await one provider under its deadline and shape its payload──
+    # ═══════════════════════════════════════════════════════════════
+    try:
+        result = await asyncio.wait_for(future, timeout)
+
+    except asyncio.TimeoutError:
+        # The worker thread finishes in the background (and fills the cache)
+        return {
+            "success": False,
+            "error": "timeout",
+            "message": f"{name} did not respond within {timeout}s"
+        }
+
+    except Exception as e:
+        current_app.logger.error(f"Dashboard {name} error: {str(e)}")
+        return {
+            "success": False,
+            "error": "internal_error",
+            "message": f"Failed to fetch {name}"
+        }
+
+    if isinstance(result, dict) and 'error' in result:
+        return {
+            "success": False,
+            "error": result['error'],
+            "message": result.get('message', f"Failed to fetch {name}")
+        }
+
+    if key == 'drinks':
+        result = result.get('drinks', [])
+
+    return {"success": True, key: result}
+
+# ─── Routes ───────────────────────────────────────────────────
+
+@dashboard_bp.route("/", methods=["GET"])
+@jwt_required()
+async def get_dashboard():
+    # ═══════════════════════════════════════════════════════════════
+    # ───All dashboard widgets in one round trip, slowest-call bound──
+    # ═══════════════════════════════════════════════════════════════
+    started = time.monotonic()
+    user_id = current_user_id()
+    location = request.args.get('location', '').strip()
+    timeouts = current_app.config.get('DASHBOARD_TIMEOUTS', {})
+    default_timeout = timeouts.get('default', 5)
+
+    # ─── Start Every Provider Before Awaiting Any ───────────────
+    # name → (future, payload key matching the standalone endpoint)
+    calls = {
+        'stats': (async_executor.submit(get_content_stats, user_id), 'stats'),
+        'apod': (async_executor.submit(nasa_api.get_apod), 'data'),
+        'drink': (async_executor.submit(drink_api.get_random_cocktail), 'drinks')
+    }
+    if location:
+        calls['weather'] = (async_executor.submit(weather_api.get_current_weather, location), 'data')
+
+    # ─── Merge Whatever Finished In Time ────────────────────────
+    names = list(calls)
+    results = await asyncio.gather(*(
+        settle(name, future, timeouts.get(name, default_timeout), key)
+        for name, (future, key) in calls.items()
+    ))
+    providers = dict(zip(names, results))
+
+    return jsonify({
+        "success": True,
+        "providers": providers,
+        "timedOut": [name for name, result in providers.items() if result.get('error') == 'timeout'],
+        "elapsedMs": round((time.monotonic() - started) * 1000)
+    }), 200
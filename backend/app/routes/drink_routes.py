@@ -1,5 +1,6 @@
 from flask import Blueprint, request, jsonify, current_app
-from app.services.drink_api import drink_api
+from app.json_provider import spliced_response
+from app.services.drink_api import drink_api, async_drink_api
 
 # ═══════════════════════════════════════════════════════════════
 # Drink Routes
@@ -8,7 +9,7 @@ from app.services.drink_api import drink_api
 drink_bp = Blueprint('drinks', __name__, url_prefix='/api/drinks')
 
 @drink_bp.route('/search', methods=['GET'])
-def search_cocktails():
+async def search_cocktails():
     # ═══════════════════════════════════════════════════════════════
     # ─────────Search for cocktails using TheCocktailDB API──────────
     # ═══════════════════════════════════════════════════════════════    
@@ -25,12 +26,10 @@ def search_cocktails():
     
     # ─── Fetch Data ─────────────────────────────────────────────
     try:
-        results = drink_api.search_cocktails(query)
+        # Upstream JSON is passed through as bytes, never decoded here
+        body = await async_drink_api.search_cocktails(query, as_bytes=True)
         
-        return jsonify({
-            "success": True,
-            "drinks": results.get('drinks', [])
-        }), 200
+        return spliced_response(body, success=True)
         
     except Exception as e:
         current_app.logger.error(f"Drink search error: {str(e)}")
@@ -1,5 +1,6 @@
 from flask import Blueprint, request, jsonify, current_app
-from app.services.meal_api import search_meals, get_meal_by_id
+from app.json_provider import spliced_response
+from app.services.meal_api import async_search_meals, get_meal_by_id
 
 # ═══════════════════════════════════════════════════════════════
 # Meal Routes
@@ -8,7 +9,7 @@ from app.services.meal_api import search_meals, get_meal_by_id
 meal_bp = Blueprint("meal", __name__, url_prefix="/meals")
 
 @meal_bp.route("/search", methods=["GET"])
-def search():
+async def search():
     # ═══════════════════════════════════════════════════════════════
     # ──────────────────Search for meals by name─────────────────────
     # ═══════════════════════════════════════════════════════════════    
@@ -25,12 +26,10 @@ def search():
     
     # ─── Fetch Data ─────────────────────────────────────────────
     try:
-        results = search_meals(query)
+        # Upstream JSON is passed through as bytes, never decoded here
+        body = await async_search_meals(query, as_bytes=True)
         
-        return jsonify({
-            "success": True,
-            "meals": results.get('meals', [])
-        }), 200
+        return spliced_response(body, success=True)
         
     except Exception as e:
         current_app.logger.error(f"Meal search error: {str(e)}")
@@ -1,6 +1,6 @@
 from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required
-from app.services.nasa_api import nasa_api
+from app.services.nasa_api import nasa_api, async_nasa_api
 
 # ═══════════════════════════════════════════════════════════════
 # NASA Routes
@@ -10,13 +10,13 @@ nasa_bp = Blueprint("nasa", __name__, url_prefix="/api/nasa")
 
 @nasa_bp.route("/apod", methods=["GET"])
 @jwt_required(optional=True)
-def get_apod():
+async def get_apod():
     # ═══════════════════════════════════════════════════════════════
     # ───────────────Get Astronomy Picture of the Day────────────────
     # ═══════════════════════════════════════════════════════════════    
     try:
         date = request.args.get('date')
-        apod_data = nasa_api.get_apod(date)
+        apod_data = await async_nasa_api.get_apod(date)
         
         if isinstance(apod_data, dict) and 'error' in apod_data:
             return jsonify({
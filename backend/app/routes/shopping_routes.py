@@ -1,7 +1,12 @@
 from flask import Blueprint, request, jsonify, current_app
-from flask_jwt_extended import jwt_required, get_jwt_identity
-from app.models import ShoppingListItem
+from flask_jwt_extended import jwt_required
+from app.models import IndexedRecipe, ShoppingListItem, UserDataVersion
 from app import db
+from app.services.conditional import conditional_get
+from app.services.drink_api import drink_api
+from app.services.identity import current_user_id, owned
+from app.services.ingredients import clean_name, extract_ingredients, merge_measures, normalize_name
+from app.services.meal_api import get_meal_by_id
 
 # ═══════════════════════════════════════════════════════════════
 # Shopping List Routes
@@ -9,14 +14,32 @@ from app import db
 
 shopping_bp = Blueprint("shopping", __name__, url_prefix="/api/shopping")
 
+# source → (list section, upstream result key, recipe name field)
+RECIPE_SOURCES = {
+    'meal':  ('food', 'meals', 'strMeal'),
+    'drink': ('drinks', 'drinks', 'strDrink')
+}
+
+# ─── Helper Functions ──────────────────────────────────────────
+
+def parse_ids(data):
+    # Returns the 'ids' list, or None when missing/malformed
+    ids = data.get('ids')
+    if not isinstance(ids, list) or not ids or not all(isinstance(item_id, int) for item_id in ids):
+        return None
+    return ids
+
+# ─── Routes ───────────────────────────────────────────────────
+
 @shopping_bp.route("/", methods=["GET"])
 @jwt_required()
+@conditional_get('shopping')
 def get_list():
     # ═══════════════════════════════════════════════════════════════
     # ───────Get all shopping list items for the current user────────
     # ═══════════════════════════════════════════════════════════════ 
     try:
-        user_id = int(get_jwt_identity())
+        user_id = current_user_id()
         items = ShoppingListItem.query.filter_by(user_id=user_id)\
                     .order_by(ShoppingListItem.created_at.asc()).all()
         result = { 'food': [], 'drinks': [] }
@@ -27,6 +50,30 @@ def get_list():
         current_app.logger.error(f"Get shopping list error: {str(e)}")
         return jsonify({ 'success': False, 'message': 'Failed to fetch shopping list' }), 500
 
+@shopping_bp.route("/suggestions", methods=["GET"])
+@jwt_required()
+def get_suggestions():
+    # ═══════════════════════════════════════════════════════════════
+    # ──Meals/drinks ranked by overlap with the list (local index)───
+    # ═══════════════════════════════════════════════════════════════
+    try:
+        user_id = current_user_id()
+        source = request.args.get('source')
+        limit = min(int(request.args.get('limit', 10)), 50)
+
+        if source is not None and source not in RECIPE_SOURCES:
+            return jsonify({ 'success': False, 'message': "source must be 'meal' or 'drink'" }), 400
+
+        names = db.session.query(ShoppingListItem.name).filter_by(user_id=user_id)
+        have = sorted({ normalize_name(name) for name, in names })
+
+        suggestions = IndexedRecipe.suggest(have, source, limit)
+        return jsonify({ 'success': True, 'suggestions': suggestions }), 200
+
+    except Exception as e:
+        current_app.logger.error(f"Shopping suggestions error: {str(e)}")
+        return jsonify({ 'success': False, 'message': 'Failed to fetch recipe suggestions' }), 500
+
 @shopping_bp.route("/", methods=["POST"])
 @jwt_required()
 def add_item():
@@ -34,10 +81,10 @@ def add_item():
     # ─Add an item to the shopping list (prevents duplicates per section)─
     # ════════════════════════════════════════════════════════════════════ 
     try:
-        user_id = int(get_jwt_identity())
+        user_id = current_user_id()
         data = request.get_json()
         section = data.get('section', 'food')
-        name    = data.get('name', '').strip()
+        name    = clean_name(data.get('name', ''))
         measure = data.get('measure', '').strip()
 
         if not name:
@@ -46,13 +93,14 @@ def add_item():
         # Prevent duplicates
         existing = ShoppingListItem.query.filter_by(
             user_id=user_id, section=section
-        ).filter(db.func.lower(ShoppingListItem.name) == name.lower()).first()
+        ).filter(db.func.lower(ShoppingListItem.name) == normalize_name(name)).first()
 
         if existing:
             return jsonify({ 'success': True, 'item': existing.to_dict(), 'duplicate': True }), 200
 
         item = ShoppingListItem(user_id=user_id, section=section, name=name, measure=measure)
         db.session.add(item)
+        UserDataVersion.bump(user_id, 'shopping')
         db.session.commit()
         return jsonify({ 'success': True, 'item': item.to_dict() }), 201
 
@@ -68,11 +116,12 @@ def toggle_item(item_id):
     # ───────────────Toggle checked status of an item────────────────
     # ═══════════════════════════════════════════════════════════════ 
     try:
-        user_id = int(get_jwt_identity())
-        item = ShoppingListItem.query.get_or_404(item_id)
-        if item.user_id != user_id:
-            return jsonify({ 'success': False, 'message': 'Unauthorized' }), 403
+        user_id = current_user_id()
+        item = owned(ShoppingListItem, item_id)
+        if item is None:
+            return jsonify({ 'success': False, 'message': 'Item not found' }), 404
         item.checked = not item.checked
+        UserDataVersion.bump(user_id, 'shopping')
         db.session.commit()
         return jsonify({ 'success': True, 'item': item.to_dict() }), 200
     except Exception as e:
@@ -86,11 +135,12 @@ def delete_item(item_id):
     # ──────────────Delete a single shopping list item───────────────
     # ═══════════════════════════════════════════════════════════════ 
     try:
-        user_id = int(get_jwt_identity())
-        item = ShoppingListItem.query.get_or_404(item_id)
-        if item.user_id != user_id:
-            return jsonify({ 'success': False, 'message': 'Unauthorized' }), 403
+        user_id = current_user_id()
+        item = owned(ShoppingListItem, item_id)
+        if item is None:
+            return jsonify({ 'success': False, 'message': 'Item not found' }), 404
         db.session.delete(item)
+        UserDataVersion.bump(user_id, 'shopping')
         db.session.commit()
         return jsonify({ 'success': True }), 200
     except Exception as e:
@@ -104,14 +154,248 @@ def clear_checked():
     # ────────Remove all checked items for the current user──────────
     # ═══════════════════════════════════════════════════════════════ 
     try:
-        user_id = int(get_jwt_identity())
+        user_id = current_user_id()
         section = request.args.get('section')
         query = ShoppingListItem.query.filter_by(user_id=user_id, checked=True)
         if section:
             query = query.filter_by(section=section)
         query.delete()
+        UserDataVersion.bump(user_id, 'shopping')
         db.session.commit()
         return jsonify({ 'success': True }), 200
     except Exception as e:
         db.session.rollback()
-        return jsonify({ 'success': False, 'message': 'Failed to clear items' }), 500
\ No newline at end of file
+        return jsonify({ 'success': False, 'message': 'Failed to clear items' }), 500
+
+@shopping_bp.route("/batch", methods=["POST"])
+@jwt_required()
+def add_items_batch():
+    # ═══════════════════════════════════════════════════════════════
+    # ─Add a whole ingredient list: one duplicate lookup, one insert─
+    # ═══════════════════════════════════════════════════════════════
+    # Body: { section, items: [{name, measure}] } or { section, recipe: {strIngredientN...} }
+    try:
+        user_id = current_user_id()
+        data = request.get_json() or {}
+        section = data.get('section', 'food')
+
+        if isinstance(data.get('recipe'), dict):
+            entries = [{'name': name, 'measure': measure} for name, measure in extract_ingredients(data['recipe'])]
+        else:
+            entries = data.get('items')
+
+        if not isinstance(entries, list) or not entries:
+            return jsonify({ 'success': False, 'message': "Provide a non-empty 'items' array or a 'recipe' object" }), 400
+
+        # ─── Clean Input, Collapsing In-request Repeats ─────────
+        wanted = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            name = clean_name(entry.get('name'))
+            if name and normalize_name(name) not in wanted:
+                wanted[normalize_name(name)] = (name, (entry.get('measure') or '').strip())
+
+        if not wanted:
+            return jsonify({ 'success': False, 'message': 'Name is required' }), 400
+
+        # ─── Duplicates Against Existing Rows (one query) ───────
+        existing = ShoppingListItem.query.filter(
+            ShoppingListItem.user_id == user_id,
+            ShoppingListItem.section == section,
+            db.func.lower(ShoppingListItem.name).in_(wanted)
+        ).all()
+        existing_names = {normalize_name(item.name) for item in existing}
+
+        # ─── Insert New Rows (single multi-row INSERT) ──────────
+        new_rows = [
+            { 'user_id': user_id, 'section': section, 'name': name, 'measure': measure }
+            for key, (name, measure) in wanted.items() if key not in existing_names
+        ]
+        items = []
+        if new_rows:
+            db.session.execute(db.insert(ShoppingListItem).values(new_rows))
+            items = ShoppingListItem.query.filter(
+                ShoppingListItem.user_id == user_id,
+                ShoppingListItem.section == section,
+                db.func.lower(ShoppingListItem.name).in_([normalize_name(row['name']) for row in new_rows])
+            ).order_by(ShoppingListItem.id.asc()).all()
+
+        # Serialize before commit expires the instances
+        result = {
+            'success': True,
+            'items': [item.to_dict() for item in items],
+            'duplicates': [item.to_dict() for item in existing]
+        }
+        if items:
+            UserDataVersion.bump(user_id, 'shopping')
+            db.session.commit()
+
+        return jsonify(result), 201 if items else 200
+
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Batch add shopping items error: {str(e)}")
+        return jsonify({ 'success': False, 'message': 'Failed to add items' }), 500
+
+@shopping_bp.route("/batch/toggle", methods=["PUT"])
+@jwt_required()
+def toggle_items_batch():
+    # ═══════════════════════════════════════════════════════════════
+    # ──Flip (or set with 'checked') many items in one UPDATE────────
+    # ═══════════════════════════════════════════════════════════════
+    try:
+        user_id = current_user_id()
+        data = request.get_json() or {}
+        ids = parse_ids(data)
+        if ids is None:
+            return jsonify({ 'success': False, 'message': "Provide a non-empty 'ids' array of integers" }), 400
+
+        checked = data.get('checked')
+        value = bool(checked) if checked is not None else db.not_(ShoppingListItem.checked)
+
+        query = ShoppingListItem.query.filter(
+            ShoppingListItem.user_id == user_id,
+            ShoppingListItem.id.in_(ids)
+        )
+        updated = query.update({ ShoppingListItem.checked: value }, synchronize_session=False)
+        items = []
+        if updated:
+            # A no-op must not invalidate every client's cached list
+            UserDataVersion.bump(user_id, 'shopping')
+            db.session.commit()
+            items = query.all()
+
+        found = { item.id for item in items }
+        return jsonify({
+            'success': True,
+            'items': [item.to_dict() for item in items],
+            'results': [
+                { 'id': item_id, 'status': 'updated' if item_id in found else 'not_found' }
+                for item_id in ids
+            ]
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Batch toggle shopping items error: {str(e)}")
+        return jsonify({ 'success': False, 'message': 'Failed to toggle items' }), 500
+
+@shopping_bp.route("/batch", methods=["DELETE"])
+@jwt_required()
+def delete_items_batch():
+    # ═══════════════════════════════════════════════════════════════
+    # ────────────Delete many items by id in one statement───────────
+    # ═══════════════════════════════════════════════════════════════
+    try:
+        user_id = current_user_id()
+        ids = parse_ids(request.get_json() or {})
+        if ids is None:
+            return jsonify({ 'success': False, 'message': "Provide a non-empty 'ids' array of integers" }), 400
+
+        # ─── Find Owned Items, Then Delete Only Those ───────────
+        found = { item_id for (item_id,) in db.session.query(ShoppingListItem.id).filter(
+            ShoppingListItem.user_id == user_id,
+            ShoppingListItem.id.in_(ids)
+        ) }
+        deleted = 0
+        if found:
+            deleted = ShoppingListItem.query.filter(
+                ShoppingListItem.user_id == user_id,
+                ShoppingListItem.id.in_(found)
+            ).delete(synchronize_session=False)
+        if deleted:
+            UserDataVersion.bump(user_id, 'shopping')
+            db.session.commit()
+
+        return jsonify({
+            'success': True,
+            'deleted': deleted,
+            'results': [
+                { 'id': item_id, 'status': 'deleted' if item_id in found else 'not_found' }
+                for item_id in ids
+            ]
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Batch delete shopping items error: {str(e)}")
+        return jsonify({ 'success': False, 'message': 'Failed to delete items' }), 500
+
+@shopping_bp.route("/from-recipe", methods=["POST"])
+@jwt_required()
+def add_recipe():
+    # ═══════════════════════════════════════════════════════════════
+    # ──Add a meal's or drink's ingredients, merging repeated ones───
+    # ═══════════════════════════════════════════════════════════════
+    # Body: { source: 'meal' | 'drink', id }
+    try:
+        user_id = current_user_id()
+        data = request.get_json() or {}
+        source = data.get('source')
+        recipe_id = str(data.get('id') or '').strip()
+
+        if source not in RECIPE_SOURCES or not recipe_id:
+            return jsonify({ 'success': False, 'message': "Provide 'source' ('meal' or 'drink') and 'id'" }), 400
+
+        # ─── Resolve Recipe (cached upstream lookup) ────────────
+        section, result_key, name_key = RECIPE_SOURCES[source]
+        if source == 'meal':
+            result = get_meal_by_id(recipe_id)
+        else:
+            result = drink_api.get_cocktail_by_id(recipe_id)
+
+        records = (result or {}).get(result_key)
+        if not isinstance(records, list) or not records:
+            return jsonify({ 'success': False, 'message': 'Recipe not found' }), 404
+        recipe = records[0]
+
+        # ─── Collapse Repeats Within the Recipe ─────────────────
+        wanted = {}
+        for name, measure in extract_ingredients(recipe):
+            key = normalize_name(name)
+            if key in wanted:
+                wanted[key] = (wanted[key][0], merge_measures(wanted[key][1], measure))
+            else:
+                wanted[key] = (clean_name(name), measure)
+
+        # ─── Merge Into Existing Rows, Insert the Rest ──────────
+        existing = ShoppingListItem.query.filter(
+            ShoppingListItem.user_id == user_id,
+            ShoppingListItem.section == section,
+            db.func.lower(ShoppingListItem.name).in_(wanted)
+        ).all()
+
+        merged = []
+        for item in existing:
+            key = normalize_name(item.name)
+            if key not in wanted:
+                continue
+            _, measure = wanted.pop(key)
+            item.measure = merge_measures(item.measure, measure)
+            item.checked = False  # More of it is needed again
+            merged.append(item)
+
+        added = [
+            ShoppingListItem(user_id=user_id, section=section, name=name, measure=measure)
+            for name, measure in wanted.values()
+        ]
+        db.session.add_all(added)
+        db.session.flush()
+
+        # Serialize before commit expires the instances
+        response = {
+            'success': True,
+            'recipe': { 'source': source, 'id': recipe_id, 'name': recipe.get(name_key) },
+            'added': [item.to_dict() for item in added],
+            'merged': [item.to_dict() for item in merged]
+        }
+        UserDataVersion.bump(user_id, 'shopping')
+        db.session.commit()
+
+        return jsonify(response), 201 if added else 200
+
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Add recipe to shopping list error: {str(e)}")
+        return jsonify({ 'success': False, 'message': 'Failed to add recipe ingredients' }), 500
@@ -1,6 +1,6 @@
 from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required
-from app.services.weather_api import weather_api
+from app.services.weather_api import async_weather_api
 
 # ═══════════════════════════════════════════════════════════════
 # Weather Routes
@@ -10,7 +10,7 @@ weather_bp = Blueprint("weather", __name__, url_prefix="/api/weather")
 
 @weather_bp.route("/current", methods=["GET"])
 @jwt_required(optional=True)
-def get_current_weather():
+async def get_current_weather():
     # ═══════════════════════════════════════════════════════════════
     # ───Get current weather for a location using WeatherStack API───
     # ═══════════════════════════════════════════════════════════════     
@@ -26,7 +26,7 @@ def get_current_weather():
     
     # ─── Fetch Data ─────────────────────────────────────────────
     try:
-        weather_data = weather_api.get_current_weather(location)
+        weather_data = await async_weather_api.get_current_weather(location)
         
         # Check if API returned an error
         if isinstance(weather_data, dict) and 'error' in weather_data:
@@ -0,0 +1,130 @@
+import atexit
+import os
+import threading
+from datetime import datetime
+from flask import current_app
+from app import db
+from app.models import User
+
+# ═══════════════════════════════════════════════════════════════
+# Buffered Activity Tracker
+# ═══════════════════════════════════════════════════════════════
+#
+# Logins record the user's last_login here instead of writing the
+# user row inside the request. A background thread writes everything
+# buffered every ACTIVITY_FLUSH_INTERVAL seconds as one UPDATE:
+#
+#   UPDATE user SET last_login = CASE id WHEN 1 THEN ... END
+#   WHERE id IN (...) AND (last_login IS NULL OR last_login < CASE ...)
+#
+# The WHERE guard means a slower worker process can never move a
+# timestamp backwards. Failed flushes are put back in the buffer,
+# and whatever is still buffered is written when the process exits.
+# ACTIVITY_FLUSH_INTERVAL = 0 writes through on every login.
+
+
+class ActivityTracker:
+    # ═══════════════════════════════════════════════════════════════
+    # ────────In-memory last-login buffer with periodic flushes──────
+    # ═══════════════════════════════════════════════════════════════
+    def __init__(self):
+        self.app = None
+        self.flush_interval = 30
+        self.max_pending = 1000
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    def init_app(self, app):
+        self.app = app
+        self.flush_interval = app.config.get('ACTIVITY_FLUSH_INTERVAL', self.flush_interval)
+        self.max_pending = app.config.get('ACTIVITY_MAX_PENDING', self.max_pending)
+
+        atexit.register(self.flush)
+        app.extensions['activity_tracker'] = self
+
+    # ─── Recording ────────────────────────────────────────────
+
+    def record_login(self, user_id, when=None):
+        when = when or datetime.utcnow()
+        if not self.flush_interval:
+            self.write({user_id: when})
+            return when
+
+        with self._lock:
+            previous = self._pending.get(user_id)
+            if previous is None or previous < when:
+                self._pending[user_id] = when
+            full = len(self._pending) >= self.max_pending
+        self._ensure_flusher()
+
+        # A full buffer is written now rather than at the next tick
+        if full:
+            self._wake.set()
+        return when
+
+    def pending(self):
+        with self._lock:
+            return len(self._pending)
+
+    # ─── Flushing ─────────────────────────────────────────────
+
+    def _ensure_flusher(self):
+        with self._lock:
+            # gunicorn forks after import: each worker starts its own thread
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run, name='activity-flush', daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        # ═══════════════════════════════════════════════════════════════
+        # ──────Write and clear the buffer; re-buffer it on failure──────
+        # ═══════════════════════════════════════════════════════════════
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        if not batch:
+            return 0
+
+        try:
+            return self.write(batch)
+        except Exception as e:
+            # Put the batch back, keeping anything newer recorded meanwhile
+            with self._lock:
+                for user_id, when in batch.items():
+                    if self._pending.get(user_id, when) <= when:
+                        self._pending[user_id] = when
+            if self.app is not None:
+                self.app.logger.error(f"Activity flush error: {str(e)}")
+            return 0
+
+    def write(self, batch):
+        # ─── One UPDATE for the whole batch, on its own connection ──
+        app = self.app or current_app._get_current_object()
+        when = db.case(
+            {user_id: db.literal(at, User.last_login.type) for user_id, at in batch.items()},
+            value=User.id
+        )
+        stmt = db.update(User).where(
+            User.id.in_(batch),
+            db.or_(User.last_login.is_(None), User.last_login < when)
+        ).values(last_login=when)
+
+        with app.app_context():
+            with db.engine.begin() as conn:
+                return conn.execute(stmt).rowcount
+
+
+# ─── Singleton Instance ────────────────────────────────────────
+activity_tracker = ActivityTracker()
@@ -1,5 +1,9 @@
 import requests
 from flask import current_app
+from app.response_policy import mark_degraded
+from app.services.async_client import AsyncService
+from app.services.cache import cached
+from app.services.http_client import http_client
 
 # ═══════════════════════════════════════════════════════════════
 # Art Institute of Chicago API Service
@@ -22,39 +26,48 @@ class ArtAPI:
         
         # ─── Make API Request ───────────────────────────────────
         try:
-            response = requests.get(
-                f"{self.base_url}/artworks/search",
-                params={
-                    "q": query.strip(),
-                    "limit": limit,
-                    "fields": "id,title,artist_title,date_display,medium_display,artist_display,image_id"
-                },
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                # Ensure data field exists
-                if 'data' not in data:
-                    data['data'] = []
-                return data
+            data = self._fetch_search(query.strip(), limit)
+            # Ensure data field exists
+            if 'data' not in data:
+                data['data'] = []
+            return data
             
+        except requests.exceptions.HTTPError as e:
+            mark_degraded()
             # Log error but return empty results
-            current_app.logger.error(f"Art API error: {response.status_code}")
+            current_app.logger.error(f"Art API error: {e.response.status_code}")
             return {"data": [], "pagination": {}}
                 
         except requests.exceptions.Timeout:
+            mark_degraded()
             current_app.logger.error("Art API timeout")
             return self._get_mock_data(limit)
             
         except requests.exceptions.ConnectionError:
+            mark_degraded()
             current_app.logger.error("Art API connection error")
             return self._get_mock_data(limit)
             
         except Exception as e:
+            mark_degraded()
             current_app.logger.error(f"Art API unexpected error: {str(e)}")
             return {"data": [], "pagination": {}}
     
+    @cached('art')
+    def _fetch_search(self, query, limit):
+        # ─── Upstream Call (raises on failure, cached on success) ─
+        response = http_client.session('art').get(
+            f"{self.base_url}/artworks/search",
+            params={
+                "q": query,
+                "limit": limit,
+                "fields": "id,title,artist_title,date_display,medium_display,artist_display,image_id"
+            },
+            timeout=10
+        )
+        response.raise_for_status()
+        return response.json()
+    
     def _get_mock_data(self, limit=12):
     # ═══════════════════════════════════════════════════════════════
     # ───Return mock data for development when API is unavailable────
@@ -82,4 +95,5 @@ class ArtAPI:
         }
 
 # ─── Singleton Instance ────────────────────────────────────────
-art_api = ArtAPI()
\ No newline at end of file
+art_api = ArtAPI()
+async_art_api = AsyncService(art_api)
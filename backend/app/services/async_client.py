@@ -0,0 +1,95 @@
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+from flask import current_app, g, has_app_context
+
+# ═══════════════════════════════════════════════════════════════
+# Async Upstream Client Layer
+# ═══════════════════════════════════════════════════════════════
+#
+# Awaitable wrappers around the blocking services in app/services.
+# Upstream calls run on a bounded, process-wide thread pool that
+# reuses the pooled keep-alive sessions from http_client, so one
+# async view can keep many upstream requests in flight at once.
+# Each call runs inside its own app context (and therefore its own
+# DB session) with the caller's context variables copied over; a
+# fallback taken there (mark_degraded) is copied back to the caller's g.
+
+class AsyncExecutor:
+    # ═══════════════════════════════════════════════════════════════
+    # ────────Bounded thread pool shared by all async views──────────
+    # ═══════════════════════════════════════════════════════════════
+    def __init__(self):
+        self.max_workers = 32
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.max_workers = app.config.get('ASYNC_UPSTREAM_WORKERS', self.max_workers)
+        app.extensions['async_executor'] = self
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='upstream'
+                )
+            return self._executor
+
+    def submit(self, func, *args, **kwargs):
+        # ─── Schedule Now, Await Later ──────────────────────────
+        # Returns an asyncio future immediately so callers can start
+        # several upstream calls before awaiting any of them
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        app, caller_g = None, None
+        if has_app_context():
+            app, caller_g = current_app._get_current_object(), g._get_current_object()
+        return loop.run_in_executor(
+            self._pool(), partial(context.run, _call_in_app, app, caller_g, func, args, kwargs)
+        )
+
+    async def run(self, func, *args, **kwargs):
+        return await self.submit(func, *args, **kwargs)
+
+    def wrap(self, func):
+        # ─── Awaitable Twin of a Blocking Function ──────────────
+        @wraps(func)
+        async def call(*args, **kwargs):
+            return await self.run(func, *args, **kwargs)
+
+        return call
+
+
+def _call_in_app(app, caller_g, func, args, kwargs):
+    # A fresh app context gives the worker its own scoped DB session,
+    # so concurrent calls never share the request's session
+    if app is None:
+        return func(*args, **kwargs)
+    with app.app_context():
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if g.get('degraded'):
+                caller_g.degraded = True
+
+
+class AsyncService:
+    # ═══════════════════════════════════════════════════════════════
+    # ──Awaitable view of a service object or module's public calls──
+    # ═══════════════════════════════════════════════════════════════
+    def __init__(self, service):
+        self._service = service
+
+    def __getattr__(self, name):
+        attr = getattr(self._service, name)
+        if not callable(attr):
+            return attr
+        return async_executor.wrap(attr)
+
+
+# ─── Singleton Instance ────────────────────────────────────────
+async_executor = AsyncExecutor()
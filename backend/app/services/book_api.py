@@ -1,5 +1,9 @@
 import requests
 from flask import current_app
+from app.response_policy import mark_degraded
+from app.services.async_client import AsyncService
+from app.services.cache import cached
+from app.services.http_client import http_client
 
 # ═══════════════════════════════════════════════════════════════
 # Open Library API Service
@@ -22,34 +26,28 @@ class BookAPI:
         
         # ─── Make API Request ───────────────────────────────────
         try:
-            response = requests.get(
-                f"{self.base_url}/search.json",
-                params={
-                    "q": query.strip(),
-                    "limit": limit,
-                    "fields": "key,title,author_name,first_publish_year,isbn,cover_i,publisher,number_of_pages_median,subject"
-                },
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if 'docs' not in data:
-                    data['docs'] = []
-                return data
+            data = self._fetch_search(query.strip(), limit)
+            if 'docs' not in data:
+                data['docs'] = []
+            return data
             
-            current_app.logger.error(f"Book API error: {response.status_code}")
+        except requests.exceptions.HTTPError as e:
+            mark_degraded()
+            current_app.logger.error(f"Book API error: {e.response.status_code}")
             return {"docs": [], "numFound": 0}
                 
         except requests.exceptions.Timeout:
+            mark_degraded()
             current_app.logger.error("Book API timeout")
             return self._get_mock_data(limit)
             
         except requests.exceptions.ConnectionError:
+            mark_degraded()
             current_app.logger.error("Book API connection error")
             return self._get_mock_data(limit)
             
         except Exception as e:
+            mark_degraded()
             current_app.logger.error(f"Book API error: {str(e)}")
             return {"docs": [], "numFound": 0}
     
@@ -58,20 +56,39 @@ class BookAPI:
         # ──────Get detailed information about a specific book───────────
         # ═══════════════════════════════════════════════════════════════        
         try:
-            response = requests.get(
-                f"{self.base_url}{work_key}.json",
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                return response.json()
+            return self._fetch_details(work_key)
             
+        except requests.exceptions.HTTPError:
             return None
                 
         except Exception as e:
             current_app.logger.error(f"Book details error: {str(e)}")
             return None
     
+    @cached('books')
+    def _fetch_search(self, query, limit):
+        # ─── Upstream Call (raises on failure, cached on success) ─
+        response = http_client.session('books').get(
+            f"{self.base_url}/search.json",
+            params={
+                "q": query,
+                "limit": limit,
+                "fields": "key,title,author_name,first_publish_year,isbn,cover_i,publisher,number_of_pages_median,subject"
+            },
+            timeout=10
+        )
+        response.raise_for_status()
+        return response.json()
+    
+    @cached('books')
+    def _fetch_details(self, work_key):
+        response = http_client.session('books').get(
+            f"{self.base_url}{work_key}.json",
+            timeout=10
+        )
+        response.raise_for_status()
+        return response.json()
+    
     def _get_mock_data(self, limit=20):
     # ═══════════════════════════════════════════════════════════════
     # ───Return mock data for development when API is unavailable────
@@ -101,4 +118,5 @@ class BookAPI:
         }
 
 # ─── Singleton Instance ────────────────────────────────────────
-book_api = BookAPI()
\ No newline at end of file
+book_api = BookAPI()
+async_book_api = AsyncService(book_api)
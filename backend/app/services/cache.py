@@ -0,0 +1,410 @@
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from flask import current_app, has_app_context
+from app.services.quota import background_priority
+from app.services.single_flight import single_flight
+
+# ═══════════════════════════════════════════════════════════════
+# Upstream Response Cache
+# ═══════════════════════════════════════════════════════════════
+#
+# Every external API service in app/services wraps its upstream
+# fetch with @cached(<namespace>). Successful responses are stored
+# as JSON bytes in a pluggable backend:
+#
+#   memory  → per-process LRU with TTL (default)
+#   sqlite  → file-backed store shared by all gunicorn workers
+#
+# Failures are never cached: the wrapped fetch raises and the
+# service's existing fallback (mock data / error dict) kicks in.
+# Concurrent misses for the same key share one upstream call
+# (see single_flight.py).
+#
+# Stale-while-revalidate: entries outlive their TTL by a per-service
+# stale window. A stale hit is returned immediately while one
+# background refresh per key fetches a new value; if that refresh
+# fails (provider down, circuit open) the stale value keeps being
+# served until the window closes.
+
+_MISSING = object()
+
+COUNTERS = ('hits', 'stale_hits', 'misses', 'sets', 'evictions', 'revalidations', 'revalidation_errors')
+
+
+class MemoryBackend:
+    # ═══════════════════════════════════════════════════════════════
+    # ─────────────In-process LRU store with per-entry TTL───────────
+    # ═══════════════════════════════════════════════════════════════
+    name = 'memory'
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        # Returns the number of entries evicted to make room
+        evicted = 0
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+
+        return evicted
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def size(self):
+        return len(self._entries)
+
+
+class SQLiteBackend:
+    # ═══════════════════════════════════════════════════════════════
+    # ─────File-backed store shared across gunicorn worker processes─
+    # ═══════════════════════════════════════════════════════════════
+    name = 'sqlite'
+
+    PRUNE_EVERY = 64  # Sets between expiry/LRU sweeps
+
+    def __init__(self, path, max_entries=10000):
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._sets = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_cache_entries_accessed_at "
+            "ON cache_entries (accessed_at)"
+        )
+
+    def _connection(self):
+        # One connection per thread; sqlite3 connections are not thread-safe
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        conn = self._connection()
+        now = time.time()
+        row = conn.execute(
+            "SELECT value FROM cache_entries WHERE key = ? AND expires_at > ?",
+            (key, now)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        conn.execute(
+            "UPDATE cache_entries SET accessed_at = ? WHERE key = ?",
+            (now, key)
+        )
+        return bytes(row[0])
+
+    def set(self, key, value, ttl):
+        conn = self._connection()
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_entries (key, value, expires_at, accessed_at) "
+            "VALUES (?, ?, ?, ?)",
+            (key, sqlite3.Binary(value), now + ttl, now)
+        )
+
+        self._sets += 1
+        if self._sets % self.PRUNE_EVERY:
+            return 0
+        return self._prune(conn, now)
+
+    def _prune(self, conn, now):
+        # Drop expired rows, then the least recently used beyond capacity
+        conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        cursor = conn.execute(
+            "DELETE FROM cache_entries WHERE key IN ("
+            " SELECT key FROM cache_entries"
+            " ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+        return max(cursor.rowcount, 0)
+
+    def delete(self, key):
+        self._connection().execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+
+    def clear(self):
+        self._connection().execute("DELETE FROM cache_entries")
+
+    def size(self):
+        return self._connection().execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+
+
+class ResponseCache:
+    # ═══════════════════════════════════════════════════════════════
+    # ──────Namespaced cache facade with per-service TTLs and stats──
+    # ═══════════════════════════════════════════════════════════════
+    def __init__(self):
+        self.backend = MemoryBackend()
+        self.enabled = True
+        self.default_ttl = 300
+        self.ttls = {}
+        self.default_stale_ttl = 0
+        self.stale_ttls = {}
+        self.revalidate_workers = 4
+        self._refresher = None
+        self._refreshing = set()
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        # ─── Select Backend ─────────────────────────────────────
+        backend = app.config.get('CACHE_BACKEND', 'memory')
+        max_entries = app.config.get('CACHE_MAX_ENTRIES', 1024)
+
+        if backend == 'sqlite':
+            path = app.config.get('CACHE_SQLITE_PATH') or os.path.join(
+                app.instance_path, 'upstream_cache.db'
+            )
+            self.backend = SQLiteBackend(path, max_entries)
+        else:
+            self.backend = MemoryBackend(max_entries)
+
+        self.enabled = app.config.get('CACHE_ENABLED', True)
+        self.default_ttl = app.config.get('CACHE_DEFAULT_TTL', 300)
+        self.ttls = dict(app.config.get('CACHE_TTLS', {}))
+        self.default_stale_ttl = app.config.get('CACHE_STALE_TTL', 0)
+        self.stale_ttls = dict(app.config.get('CACHE_STALE_TTLS', {}))
+        self.revalidate_workers = app.config.get('CACHE_REVALIDATE_WORKERS', self.revalidate_workers)
+
+        app.extensions['response_cache'] = self
+
+    def ttl_for(self, namespace):
+        return self.ttls.get(namespace, self.default_ttl)
+
+    def stale_ttl_for(self, namespace):
+        return self.stale_ttls.get(namespace, self.default_stale_ttl)
+
+    def get(self, namespace, key):
+        # Returns (value, is_stale), or _MISSING
+        entry = self.get_raw(namespace, key)
+        if entry is _MISSING:
+            return _MISSING
+        body, is_stale = entry
+        return json.loads(body), is_stale
+
+    def get_raw(self, namespace, key):
+        # ─── (JSON bytes, is_stale) without decoding, or _MISSING ─
+        raw = self.backend.get(key) if self.enabled else None
+        fresh_until = None
+
+        # Stored as b"<fresh_until>\n<json>"; older formats count as misses
+        if raw is not None and b'\n' in raw:
+            header, body = raw.split(b'\n', 1)
+            try:
+                fresh_until = float(header)
+            except ValueError:
+                pass
+
+        if fresh_until is None:
+            self._count(namespace, 'misses')
+            return _MISSING
+
+        if fresh_until > time.time():
+            self._count(namespace, 'hits')
+            return body, False
+
+        self._count(namespace, 'stale_hits')
+        return body, True
+
+    def set(self, namespace, key, value, ttl=None):
+        if not self.enabled:
+            return
+
+        ttl = self.ttl_for(namespace) if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        # The backend keeps the entry through the stale window too
+        header = f"{time.time() + ttl}\n".encode('ascii')
+        stored_ttl = ttl + max(self.stale_ttl_for(namespace), 0)
+        evicted = self.backend.set(key, header + encode_json(value), stored_ttl)
+        self._count(namespace, 'sets')
+        if evicted:
+            self._count(namespace, 'evictions', evicted)
+
+    def revalidate(self, namespace, key, fetch):
+        # ═══════════════════════════════════════════════════════════════
+        # ──────Refresh a stale entry in the background, once per key────
+        # ═══════════════════════════════════════════════════════════════
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._refresher is None:
+                self._refresher = ThreadPoolExecutor(
+                    max_workers=self.revalidate_workers,
+                    thread_name_prefix='revalidate'
+                )
+            refresher = self._refresher
+
+        app = current_app._get_current_object() if has_app_context() else None
+
+        def refresh():
+            try:
+                # Refreshes must not eat the budget kept for interactive calls
+                with background_priority():
+                    if app is None:
+                        fetch()
+                    else:
+                        with app.app_context():
+                            fetch()
+                self._count(namespace, 'revalidations')
+
+            except Exception as e:
+                # Keep serving the stale value until its window closes
+                self._count(namespace, 'revalidation_errors')
+                if app is not None:
+                    app.logger.warning(f"Cache revalidation failed for {key}: {str(e)}")
+
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        refresher.submit(refresh)
+
+    def clear(self):
+        self.backend.clear()
+
+    def _count(self, namespace, counter, amount=1):
+        with self._lock:
+            counters = self._counters.setdefault(namespace, dict.fromkeys(COUNTERS, 0))
+            counters[counter] += amount
+
+    def stats(self):
+        # ═══════════════════════════════════════════════════════════════
+        # ───────Hit/miss/eviction counters for sizing the cache─────────
+        # ═══════════════════════════════════════════════════════════════
+        with self._lock:
+            namespaces = {name: dict(counters) for name, counters in self._counters.items()}
+
+        totals = dict.fromkeys(COUNTERS, 0)
+        for counters in namespaces.values():
+            for counter, value in counters.items():
+                totals[counter] += value
+
+        served = totals['hits'] + totals['stale_hits']
+        lookups = served + totals['misses']
+        totals['hit_rate'] = round(served / lookups, 4) if lookups else 0.0
+
+        return {
+            'backend': self.backend.name,
+            'enabled': self.enabled,
+            'pid': os.getpid(),
+            'entries': self.backend.size(),
+            'max_entries': self.backend.max_entries,
+            'ttls': {**self.ttls, 'default': self.default_ttl},
+            'stale_ttls': {**self.stale_ttls, 'default': self.default_stale_ttl},
+            'totals': totals,
+            'namespaces': namespaces
+        }
+
+
+def encode_json(value):
+    return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+
+def make_key(namespace, name, args, kwargs):
+    # ─── Stable Key From Call Arguments ────────────────────────
+    payload = json.dumps([args, kwargs], sort_keys=True, default=str)
+    digest = hashlib.sha1(payload.encode('utf-8')).hexdigest()
+    return f"{namespace}:{name}:{digest}"
+
+
+def cached(namespace, cache_if=None):
+    # ═══════════════════════════════════════════════════════════════
+    # ──Cache successful return values of an upstream fetch function─
+    # ═══════════════════════════════════════════════════════════════
+    # The wrapped function must raise on failure; `cache_if` can veto
+    # caching of responses that succeed at HTTP level but carry errors.
+    # Call with as_bytes=True to get the cached JSON bytes as stored,
+    # skipping the decode on hits (for pass-through responses).
+    def decorator(fn):
+        params = list(inspect.signature(fn).parameters)
+        is_method = bool(params) and params[0] == 'self'
+
+        @wraps(fn)
+        def wrapper(*args, as_bytes=False, **kwargs):
+            key_args = args[1:] if is_method else args
+            key = make_key(namespace, fn.__qualname__, key_args, kwargs)
+
+            def fetch():
+                # Stored by the leader before followers are released
+                value = fn(*args, **kwargs)
+                if cache_if is None or cache_if(value):
+                    response_cache.set(namespace, key, value)
+                return value
+
+            def coalesced_fetch():
+                return single_flight.do(namespace, key, fetch)
+
+            lookup = response_cache.get_raw if as_bytes else response_cache.get
+            entry = lookup(namespace, key)
+            if entry is _MISSING:
+                value = coalesced_fetch()
+                return encode_json(value) if as_bytes else value
+
+            value, is_stale = entry
+            if is_stale:
+                response_cache.revalidate(namespace, key, coalesced_fetch)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+# ─── Singleton Instance ────────────────────────────────────────
+response_cache = ResponseCache()
@@ -0,0 +1,94 @@
+import threading
+import time
+import requests
+
+# ═══════════════════════════════════════════════════════════════
+# Per-provider Circuit Breaker
+# ═══════════════════════════════════════════════════════════════
+#
+# After FAILURE_THRESHOLD consecutive failures (connection errors,
+# timeouts, 429/5xx after retries) a provider's circuit opens and
+# calls fail immediately for RESET_TIMEOUT seconds instead of each
+# waiting out the full request timeout. Then a single trial call is
+# let through (half-open): success closes the circuit, failure
+# re-opens it.
+#
+# CircuitOpenError is a requests ConnectionError, so every service's
+# existing `except ConnectionError` fallback handles it unchanged.
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    # Raised instead of calling a provider whose circuit is open
+    pass
+
+
+class CircuitBreaker:
+    # ═══════════════════════════════════════════════════════════════
+    # ──────────Failure tracking and fail-fast for one provider──────
+    # ═══════════════════════════════════════════════════════════════
+    def __init__(self, name, failure_threshold=5, reset_timeout=30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.rejected = 0
+        self.trips = 0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        # Raises CircuitOpenError when the call must not go upstream
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+
+            if self.state == CLOSED:
+                return
+            if self.state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+
+            self.rejected += 1
+            retry_in = max(self.reset_timeout - (time.monotonic() - self.opened_at), 0)
+
+        raise CircuitOpenError(f"{self.name} circuit is open (retry in {retry_in:.0f}s)")
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self.trips += 1
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        # The call failed on our side (bad URL, header, ...): the provider
+        # said nothing, so keep the state but let another trial through
+        with self._lock:
+            self._trial_in_flight = False
+
+    def stats(self):
+        with self._lock:
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'trips': self.trips,
+                'rejected': self.rejected,
+                'open_for': round(time.monotonic() - self.opened_at, 1) if self.opened_at else None
+            }
@@ -0,0 +1,73 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+from functools import wraps
+from flask import current_app, make_response, request
+from app.models import UserDataVersion
+from app.services.identity import current_user_id
+
+# ═══════════════════════════════════════════════════════════════
+# Conditional GETs (ETag / Last-Modified)
+# ═══════════════════════════════════════════════════════════════
+#
+# User data lists are validated against a per-user version stamp
+# (user_data_versions) that every write to the scope bumps, so an
+# unchanged list answers 304 after one primary-key lookup, without
+# running the view's queries or serializing anything.
+
+
+def conditional_get(scope):
+    # ═══════════════════════════════════════════════════════════════
+    # ──Answer 304 when the client's copy of `scope` is still current─
+    # ═══════════════════════════════════════════════════════════════
+    # Apply below @jwt_required(): the stamp is per user
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            user_id = current_user_id()
+            version, updated_at = UserDataVersion.current(user_id, scope)
+
+            # Query string is part of the tag: pages/filters differ in content
+            variant = hashlib.sha1(request.full_path.encode('utf-8')).hexdigest()[:12]
+            etag = f"{scope}-{user_id}-{version}-{variant}"
+            last_modified = http_last_modified(updated_at)
+
+            # ─── Validate the Client's Copy ─────────────────────
+            # The ETag decides whenever the client sends one
+            if request.if_none_match:
+                not_modified = request.if_none_match.contains_weak(etag)
+            else:
+                since = request.if_modified_since
+                not_modified = bool(since and last_modified and last_modified <= since)
+
+            if not_modified:
+                response = current_app.response_class(status=304)
+            else:
+                response = make_response(fn(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag, weak=True)
+            if last_modified:
+                response.last_modified = last_modified
+            # Browsers may keep the copy but must revalidate every time
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def http_last_modified(updated_at):
+    # ═══════════════════════════════════════════════════════════════
+    # ──Whole-second Last-Modified that never hides a same-second write─
+    # ═══════════════════════════════════════════════════════════════
+    # HTTP dates have one-second resolution. Rounding up to the end of
+    # the write's second, and only sending it once that second is over,
+    # means any later write gets a strictly later Last-Modified
+    if updated_at is None:
+        return None
+    end_of_second = updated_at.replace(microsecond=0) + timedelta(seconds=1)
+    if datetime.utcnow() < end_of_second:
+        return None
+    return end_of_second.replace(tzinfo=timezone.utc)
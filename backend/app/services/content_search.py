@@ -0,0 +1,110 @@
+import re
+from app import db
+from app.models import SavedItem
+
+# ═══════════════════════════════════════════════════════════════
+# Saved Item Full-text Search
+# ═══════════════════════════════════════════════════════════════
+#
+# The index lives in the database and is kept in sync there, so ORM
+# writes, batch inserts and bulk deletes are all covered:
+#   • SQLite: FTS5 table saved_items_fts (rowid = saved_items.id)
+#     maintained by INSERT/UPDATE/DELETE triggers
+#   • Postgres: GIN expression index over PG_DOCUMENT, which the
+#     planner uses because the search query repeats the expression
+#   • Other databases: unindexed ILIKE over title/notes/description,
+#     ranked by how many terms appear in the title
+# Both indexes are created by migration 5e0b7a3c9d16.
+
+# item_metadata keys worth searching (author, artist, cuisine, ...)
+METADATA_FIELDS = (
+    'author', 'artist', 'category', 'area', 'glass',
+    'ingredients', 'subjects', 'medium', 'location', 'mood'
+)
+
+# Must stay identical to the indexed expression in the migration
+PG_DOCUMENT = (
+    "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(user_notes, '')), 'B') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'C') || "
+    "setweight(to_tsvector('english'::regconfig, " + " || ' ' || ".join(
+        f"coalesce(item_metadata->>'{field}', '')" for field in METADATA_FIELDS
+    ) + "), 'D')"
+)
+
+# bm25 column weights: title, description, user_notes, metadata
+SQLITE_WEIGHTS = (10.0, 2.0, 5.0, 1.0)
+
+_TERM = re.compile(r'\w+', re.UNICODE)
+
+def search_terms(text):
+    # ─── Plain words only; FTS operators in user input are dropped ─
+    return _TERM.findall(text or '')[:10]
+
+def sqlite_match(terms):
+    # "sweet" "potato"* → every word must match, last one as a prefix
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += '*'
+    return ' '.join(quoted)
+
+def search_items(user_id, text, content_type=None, limit=20):
+    # ═══════════════════════════════════════════════════════════════
+    # ────────[(item id, rank)] best match first for one user────────
+    # ═══════════════════════════════════════════════════════════════
+    terms = search_terms(text)
+    if not terms:
+        return []
+
+    params = {'user_id': user_id, 'limit': limit}
+    type_filter = ''
+    if content_type:
+        type_filter = 'AND s.content_type = :content_type'
+        params['content_type'] = content_type
+
+    dialect = db.session.get_bind().dialect.name
+
+    if dialect == 'sqlite':
+        # bm25() is lower-is-better; negate so both backends sort DESC
+        params['query'] = sqlite_match(terms)
+        sql = f"""
+            SELECT s.id, -bm25(saved_items_fts, {', '.join(map(str, SQLITE_WEIGHTS))}) AS rank
+            FROM saved_items_fts
+            JOIN saved_items s ON s.id = saved_items_fts.rowid
+            WHERE saved_items_fts MATCH :query
+              AND s.user_id = :user_id {type_filter}
+            ORDER BY rank DESC, s.id DESC
+            LIMIT :limit
+        """
+
+    elif dialect == 'postgresql':
+        params['query'] = ' & '.join(f'{term}:*' for term in terms)
+        sql = f"""
+            SELECT s.id, ts_rank_cd({PG_DOCUMENT}, query) AS rank
+            FROM saved_items s, to_tsquery('english'::regconfig, :query) AS query
+            WHERE ({PG_DOCUMENT}) @@ query
+              AND s.user_id = :user_id {type_filter}
+            ORDER BY rank DESC, s.id DESC
+            LIMIT :limit
+        """
+
+    else:
+        return search_items_like(user_id, terms, content_type, limit)
+
+    rows = db.session.execute(db.text(sql), params)
+    return [(item_id, float(rank)) for item_id, rank in rows]
+
+def search_items_like(user_id, terms, content_type=None, limit=20):
+    # ─── Portable fallback: every term in some text column ─────
+    columns = (SavedItem.title, SavedItem.user_notes, SavedItem.description)
+    rank = sum(
+        db.case((SavedItem.title.ilike(f'%{term}%'), 1.0), else_=0.0) for term in terms
+    ).label('rank')
+
+    query = db.session.query(SavedItem.id, rank).filter(SavedItem.user_id == user_id)
+    if content_type:
+        query = query.filter(SavedItem.content_type == content_type)
+    for term in terms:
+        query = query.filter(db.or_(*(column.ilike(f'%{term}%') for column in columns)))
+
+    rows = query.order_by(rank.desc(), SavedItem.id.desc()).limit(limit)
+    return [(item_id, float(score)) for item_id, score in rows]
@@ -1,5 +1,10 @@
 import requests
 from flask import current_app
+from app.response_policy import mark_degraded
+from app.models.recipe_index import index_fetched_records
+from app.services.async_client import AsyncService
+from app.services.cache import cached, encode_json
+from app.services.http_client import http_client
 
 # ═══════════════════════════════════════════════════════════════
 # TheCocktailDB API Service
@@ -12,52 +17,56 @@ class DrinkAPI:
     def __init__(self):
         self.base_url = "https://www.thecocktaildb.com/api/json/v1/1"
     
-    def search_cocktails(self, query):
+    def search_cocktails(self, query, as_bytes=False):
         # ═══════════════════════════════════════════════════════════════
         # ───────────────Search for cocktails by name────────────────────
         # ═══════════════════════════════════════════════════════════════        
+        # as_bytes=True returns the JSON bytes (cache hits skip decoding)
+        encode = encode_json if as_bytes else (lambda value: value)
+
         # ─── Validate Input ─────────────────────────────────────
         if not query or not query.strip():
-            return {"drinks": None}
+            return encode({"drinks": None})
         
         # ─── Make API Request ───────────────────────────────────
         try:
-            response = requests.get(
-                f"{self.base_url}/search.php",
-                params={"s": query.strip()},
-                timeout=10
-            )
+            return self._fetch_search(query.strip(), as_bytes=as_bytes)
             
-            if response.status_code == 200:
-                return response.json()
-            
-            current_app.logger.error(f"Drink API error: {response.status_code}")
-            return {"drinks": None}
+        except requests.exceptions.HTTPError as e:
+            mark_degraded()
+            current_app.logger.error(f"Drink API error: {e.response.status_code}")
+            return encode({"drinks": None})
                 
         except requests.exceptions.Timeout:
+            mark_degraded()
             current_app.logger.error("Drink API timeout")
-            return self._get_mock_data()
+            return encode(self._get_mock_data())
             
         except requests.exceptions.ConnectionError:
+            mark_degraded()
             current_app.logger.error("Drink API connection error")
-            return self._get_mock_data()
+            return encode(self._get_mock_data())
             
         except Exception as e:
+            mark_degraded()
             current_app.logger.error(f"Drink API error: {str(e)}")
-            return {"drinks": None}
+            return encode({"drinks": None})
     
     def get_random_cocktail(self):
         # ═══════════════════════════════════════════════════════════════
         # ───────────────────Get a random cocktail───────────────────────
         # ═══════════════════════════════════════════════════════════════        
         try:
-            response = requests.get(
+            response = http_client.session('drinks').get(
                 f"{self.base_url}/random.php",
                 timeout=10
             )
             
             if response.status_code == 200:
-                return response.json()
+                data = response.json()
+                # Uncached path: only recipes not yet indexed are written
+                index_fetched_records('drink', data.get('drinks'), only_new=True)
+                return data
             
             return {"drinks": None}
                 
@@ -70,21 +79,40 @@ class DrinkAPI:
         # ──────────Get detailed cocktail information by ID──────────────
         # ═══════════════════════════════════════════════════════════════        
         try:
-            response = requests.get(
-                f"{self.base_url}/lookup.php",
-                params={"i": drink_id},
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                return response.json()
+            return self._fetch_lookup(drink_id)
             
+        except requests.exceptions.HTTPError:
             return {"drinks": None}
                 
         except Exception as e:
             current_app.logger.error(f"Cocktail details error: {str(e)}")
             return {"drinks": None}
     
+    @cached('drinks')
+    def _fetch_search(self, query):
+        # ─── Upstream Call (raises on failure, cached on success) ─
+        response = http_client.session('drinks').get(
+            f"{self.base_url}/search.php",
+            params={"s": query},
+            timeout=10
+        )
+        response.raise_for_status()
+        data = response.json()
+        index_fetched_records('drink', data.get('drinks'))
+        return data
+    
+    @cached('drinks')
+    def _fetch_lookup(self, drink_id):
+        response = http_client.session('drinks').get(
+            f"{self.base_url}/lookup.php",
+            params={"i": drink_id},
+            timeout=10
+        )
+        response.raise_for_status()
+        data = response.json()
+        index_fetched_records('drink', data.get('drinks'))
+        return data
+    
     def _get_mock_data(self):
         # ═══════════════════════════════════════════════════════════════
         # ──Return mock data for development when API is unavailable─────
@@ -110,4 +138,5 @@ class DrinkAPI:
         }
 
 # ─── Singleton Instance ────────────────────────────────────────
-drink_api = DrinkAPI()
\ No newline at end of file
+drink_api = DrinkAPI()
+async_drink_api = AsyncService(drink_api)
@@ -0,0 +1,183 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.services.quota import quota_manager
+
+# ═══════════════════════════════════════════════════════════════
+# Pooled HTTP Client Factory
+# ═══════════════════════════════════════════════════════════════
+#
+# Each upstream provider gets one HTTPAdapter (a keep-alive
+# connection pool) shared by all threads of the worker. Sessions are
+# per-thread and only hold the mounted adapter, so gunicorn's
+# threaded workers never share Session state such as cookies.
+# Every call is metered against the provider's quota (if any) and
+# reported to its circuit breaker.
+
+# Final statuses (after retries) that count against a provider
+FAILURE_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+
+class ProviderAdapter(HTTPAdapter):
+    # ═══════════════════════════════════════════════════════════════
+    # ──Pooled adapter that meters quota and fails fast when open────
+    # ═══════════════════════════════════════════════════════════════
+    def __init__(self, name, breaker, **kwargs):
+        self.name = name
+        self.breaker = breaker
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        # ─── Budget First, Then the Circuit ─────────────────────
+        metered = quota_manager.acquire(self.name)
+        try:
+            if self.breaker is not None:
+                self.breaker.before_call()
+        except CircuitOpenError:
+            if metered:
+                quota_manager.refund(self.name)
+            raise
+
+        try:
+            response = super().send(request, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if self.breaker is not None:
+                self.breaker.record_failure()
+            raise
+        except BaseException:
+            # Any other error must still end a half-open trial
+            if self.breaker is not None:
+                self.breaker.release()
+            raise
+
+        if self.breaker is not None:
+            if response.status_code in FAILURE_STATUSES:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+
+        # Retried attempts were upstream calls too
+        retries = getattr(response.raw, 'retries', None)
+        if metered and retries is not None and retries.history:
+            quota_manager.charge(self.name, len(retries.history))
+        return response
+
+
+class HTTPClientFactory:
+    # ═══════════════════════════════════════════════════════════════
+    # ─────Hands out keep-alive sessions per upstream provider───────
+    # ═══════════════════════════════════════════════════════════════
+    def __init__(self):
+        self.pool_connections = 4     # Host pools kept per provider
+        self.pool_maxsize = 10        # Connections kept alive per host
+        self.pool_block = True        # Cap concurrent connections per host
+        self.retries = 2
+        self.backoff_factor = 0.3
+        self.breaker_enabled = True
+        self.failure_threshold = 5    # Consecutive failures that open a circuit
+        self.reset_timeout = 30       # Seconds an open circuit fails fast
+        self._adapters = {}
+        self._breakers = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.pool_connections = app.config.get('HTTP_POOL_CONNECTIONS', self.pool_connections)
+        self.pool_maxsize = app.config.get('HTTP_POOL_MAXSIZE', self.pool_maxsize)
+        self.pool_block = app.config.get('HTTP_POOL_BLOCK', self.pool_block)
+        self.retries = app.config.get('HTTP_RETRIES', self.retries)
+        self.backoff_factor = app.config.get('HTTP_RETRY_BACKOFF', self.backoff_factor)
+        self.breaker_enabled = app.config.get('CIRCUIT_BREAKER_ENABLED', self.breaker_enabled)
+        self.failure_threshold = app.config.get('CIRCUIT_FAILURE_THRESHOLD', self.failure_threshold)
+        self.reset_timeout = app.config.get('CIRCUIT_RESET_TIMEOUT', self.reset_timeout)
+
+        app.extensions['http_client'] = self
+
+    def _adapter(self, name):
+        with self._lock:
+            adapter = self._adapters.get(name)
+            if adapter is None:
+                # Read timeouts are not retried so a dead provider still
+                # costs one timeout, not (retries + 1) of them
+                retry = Retry(
+                    total=self.retries,
+                    read=0,
+                    backoff_factor=self.backoff_factor,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset(['GET']),
+                    raise_on_status=False
+                )
+                breaker = None
+                if self.breaker_enabled:
+                    breaker = self._breakers[name] = CircuitBreaker(
+                        name, self.failure_threshold, self.reset_timeout
+                    )
+                adapter = ProviderAdapter(
+                    name,
+                    breaker,
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    pool_block=self.pool_block,
+                    max_retries=retry
+                )
+                self._adapters[name] = adapter
+            return adapter
+
+    def session(self, name):
+        # ═══════════════════════════════════════════════════════════════
+        # ─────────Thread-local session bound to a shared pool───────────
+        # ═══════════════════════════════════════════════════════════════
+        sessions = getattr(self._local, 'sessions', None)
+        if sessions is None:
+            sessions = self._local.sessions = {}
+
+        session = sessions.get(name)
+        if session is None:
+            adapter = self._adapter(name)
+            session = requests.Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            sessions[name] = session
+        return session
+
+    def stats(self):
+        # ═══════════════════════════════════════════════════════════════
+        # ─────Connection reuse per provider/host and circuit states─────
+        # ═══════════════════════════════════════════════════════════════
+        with self._lock:
+            adapters = dict(self._adapters)
+            breakers = dict(self._breakers)
+
+        providers = {}
+        for name, adapter in adapters.items():
+            hosts = {}
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                requests_made = pool.num_requests
+                opened = pool.num_connections
+                host = f"{key.key_scheme}://{key.key_host}"
+                if key.key_port:
+                    host = f"{host}:{key.key_port}"
+                hosts[host] = {
+                    'requests': requests_made,
+                    'connections_opened': opened,
+                    'reuse_rate': round(1 - opened / requests_made, 4) if requests_made else 0.0
+                }
+            providers[name] = hosts
+
+        return {
+            'pool_maxsize': self.pool_maxsize,
+            'pool_block': self.pool_block,
+            'retries': self.retries,
+            'providers': providers,
+            'circuits': {name: breaker.stats() for name, breaker in breakers.items()}
+        }
+
+
+# ─── Singleton Instance ────────────────────────────────────────
+http_client = HTTPClientFactory()
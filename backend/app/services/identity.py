@@ -0,0 +1,24 @@
+from flask import g
+from flask_jwt_extended import get_jwt_identity
+
+# ═══════════════════════════════════════════════════════════════
+# Request-Scoped Identity
+# ═══════════════════════════════════════════════════════════════
+#
+# The JWT is verified once by @jwt_required(); the integer user id is
+# then cached on `g` so decorators, views and helpers in the same
+# request share it. Per-user rows are looked up together with their
+# owner (WHERE id = ? AND user_id = ?): another user's row reads the
+# same as a missing one, so there is no fetch-then-compare step.
+
+
+def current_user_id():
+    # ─── int(get_jwt_identity()), resolved once per request ─────
+    if 'user_id' not in g:
+        g.user_id = int(get_jwt_identity())
+    return g.user_id
+
+
+def owned(model, item_id):
+    # ─── The current user's row by primary key, or None ─────────
+    return model.query.filter_by(id=item_id, user_id=current_user_id()).first()
@@ -0,0 +1,106 @@
+import re
+from fractions import Fraction
+
+# ═══════════════════════════════════════════════════════════════
+# Recipe Ingredient Helpers
+# ═══════════════════════════════════════════════════════════════
+#
+# TheMealDB and TheCocktailDB spread ingredients across numbered
+# columns (strIngredient1..20 / strMeasure1..20 for meals, 1..15 for
+# drinks). These helpers flatten them for the shopping list.
+
+MAX_INGREDIENT_SLOTS = 20
+
+def extract_ingredients(record):
+    # ═══════════════════════════════════════════════════════════════
+    # ──────[(name, measure)] from a meal or cocktail record─────────
+    # ═══════════════════════════════════════════════════════════════
+    ingredients = []
+
+    for slot in range(1, MAX_INGREDIENT_SLOTS + 1):
+        name = (record.get(f'strIngredient{slot}') or '').strip()
+        if not name:
+            continue
+        measure = (record.get(f'strMeasure{slot}') or '').strip()
+        ingredients.append((name, measure))
+
+    return ingredients
+
+def clean_name(name):
+    # ─── Stored form: trimmed, inner whitespace collapsed ───────
+    return re.sub(r'\s+', ' ', (name or '').strip())
+
+def normalize_name(name):
+    # ─── Case/whitespace-insensitive ingredient key ─────────────
+    # Equals lower(name) of a row stored through clean_name()
+    return clean_name(name).lower()
+
+# ─── Measures ──────────────────────────────────────────────────
+
+UNICODE_FRACTIONS = {
+    '¼': '1/4', '½': '1/2', '¾': '3/4', '⅓': '1/3', '⅔': '2/3', '⅛': '1/8'
+}
+
+UNIT_ALIASES = {
+    'oz': 'oz', 'ounce': 'oz', 'ounces': 'oz',
+    'cl': 'cl', 'ml': 'ml', 'l': 'l',
+    'g': 'g', 'gram': 'g', 'grams': 'g', 'kg': 'kg',
+    'lb': 'lb', 'lbs': 'lb', 'pound': 'lb', 'pounds': 'lb',
+    'cup': 'cup', 'cups': 'cup',
+    'tsp': 'tsp', 'teaspoon': 'tsp', 'teaspoons': 'tsp',
+    'tbsp': 'tbsp', 'tbs': 'tbsp', 'tablespoon': 'tbsp', 'tablespoons': 'tbsp',
+    'shot': 'shot', 'shots': 'shot', 'dash': 'dash', 'dashes': 'dash',
+    'clove': 'clove', 'cloves': 'clove', 'pinch': 'pinch', 'slice': 'slice', 'slices': 'slice'
+}
+
+_QUANTITY = re.compile(r'^\s*(\d+\s+\d+/\d+|\d+/\d+|\d+(?:\.\d+)?)\s*(.*)$')
+
+def parse_measure(measure):
+    # ═══════════════════════════════════════════════════════════════
+    # ──"1 1/2 oz" → (Fraction(3, 2), 'oz'); no number → (None, text)─
+    # ═══════════════════════════════════════════════════════════════
+    text = (measure or '').strip()
+    for symbol, fraction in UNICODE_FRACTIONS.items():
+        text = text.replace(symbol, f' {fraction}')
+
+    match = _QUANTITY.match(text)
+    if not match:
+        return None, text.strip()
+
+    amount, rest = match.groups()
+    quantity = sum(Fraction(part) for part in amount.split())
+
+    # Glued units like "200g" arrive in `rest` as "g ..."
+    unit = rest.strip().lower().rstrip('.')
+    unit = UNIT_ALIASES.get(unit, unit)
+    return quantity, unit
+
+def format_measure(quantity, unit):
+    # ─── Fraction(3, 2), 'oz' → "1 1/2 oz" ─────────────────────
+    quantity = Fraction(quantity).limit_denominator(8)
+    whole, remainder = divmod(quantity.numerator, quantity.denominator)
+
+    parts = []
+    if whole:
+        parts.append(str(whole))
+    if remainder:
+        parts.append(f"{remainder}/{quantity.denominator}")
+    if unit:
+        parts.append(unit)
+    return ' '.join(parts) or '0'
+
+def merge_measures(current, extra):
+    # ═══════════════════════════════════════════════════════════════
+    # ──Sum measures when units agree, otherwise keep both as text───
+    # ═══════════════════════════════════════════════════════════════
+    current = (current or '').strip()
+    extra = (extra or '').strip()
+    if not current or not extra:
+        return current or extra
+
+    current_qty, current_unit = parse_measure(current)
+    extra_qty, extra_unit = parse_measure(extra)
+
+    if current_qty is not None and extra_qty is not None and current_unit == extra_unit:
+        return format_measure(current_qty + extra_qty, current_unit)
+    return f"{current} + {extra}"
@@ -1,4 +1,9 @@
 import requests
+from app.models.recipe_index import index_fetched_records
+from app.response_policy import mark_degraded
+from app.services.async_client import async_executor
+from app.services.cache import cached, encode_json
+from app.services.http_client import http_client
 
 # ═══════════════════════════════════════════════════════════════
 # TheMealDB API Service
@@ -6,39 +11,50 @@ import requests
 
 BASE_URL = "https://www.themealdb.com/api/json/v1/1"
 
-def search_meals(query):
+def search_meals(query, as_bytes=False):
     # ═══════════════════════════════════════════════════════════════
     # ─────────────────Search for meals by name──────────────────────
-    # ═══════════════════════════════════════════════════════════════    
+    # ═══════════════════════════════════════════════════════════════
+    # as_bytes=True returns the JSON bytes (cache hits skip decoding)
+    empty = encode_json({"meals": []}) if as_bytes else {"meals": []}
+
     if not query or not query.strip():
-        return {"meals": []}
-    
+        return empty
+
     try:
-        response = requests.get(
-            f"{BASE_URL}/search.php",
-            params={"s": query.strip()},
-            timeout=10
-        )
-        response.raise_for_status()
-        return response.json()
-        
+        return _fetch("search.php", s=query.strip(), as_bytes=as_bytes)
+
     except requests.exceptions.RequestException as e:
+        mark_degraded()
         print(f"Meal search error: {e}")
-        return {"meals": []}
+        return empty
 
 def get_meal_by_id(meal_id):
     # ═══════════════════════════════════════════════════════════════
     # ─────────────Get detailed meal information by ID───────────────
-    # ═══════════════════════════════════════════════════════════════    
+    # ═══════════════════════════════════════════════════════════════
     try:
-        response = requests.get(
-            f"{BASE_URL}/lookup.php",
-            params={"i": meal_id},
-            timeout=10
-        )
-        response.raise_for_status()
-        return response.json()
-        
+        return _fetch("lookup.php", i=meal_id)
+
     except requests.exceptions.RequestException as e:
         print(f"Meal details error: {e}")
-        return {"meals": []}
\ No newline at end of file
+        return {"meals": []}
+
+@cached('meals')
+def _fetch(endpoint, **params):
+    # ─── Upstream Call (raises on failure, cached on success) ──
+    response = http_client.session('meals').get(
+        f"{BASE_URL}/{endpoint}",
+        params=params,
+        timeout=10
+    )
+    response.raise_for_status()
+    data = response.json()
+
+    # Full records (search/lookup) feed the ingredient index
+    index_fetched_records('meal', (data or {}).get('meals'))
+    return data
+
+# ─── Async Interface ───────────────────────────────────────────
+async_search_meals = async_executor.wrap(search_meals)
+async_get_meal_by_id = async_executor.wrap(get_meal_by_id)
@@ -1,7 +1,14 @@
 import requests
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
 from datetime import datetime, timedelta
 from flask import current_app
+from app import db
+from app.models import ApodEntry
+from app.services.async_client import AsyncService
+from app.services.cache import cached
+from app.services.http_client import http_client
 
 # ═══════════════════════════════════════════════════════════════
 # NASA API Service
@@ -26,20 +33,17 @@ class NASAAPI:
             return self._error_response('api_key_missing', 'NASA API key is not configured')
         
         try:
-            params = {'api_key': self.api_key}
-            if date:
-                params['date'] = date
+            # ─── Serve Past Dates From Archive ──────────────────
+            archived = self._archived_apod(date)
+            if archived is not None:
+                return archived
             
-            response = requests.get(
-                f"{self.base_url}/planetary/apod",
-                params=params,
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                return response.json()
+            apod = self._fetch_apod(date)
+            self._archive([apod])
+            return apod
             
-            current_app.logger.error(f"NASA APOD error: {response.status_code}")
+        except requests.exceptions.HTTPError as e:
+            current_app.logger.error(f"NASA APOD error: {e.response.status_code}")
             return self._error_response('api_error', 'Failed to fetch Astronomy Picture of the Day')
                 
         except requests.exceptions.Timeout:
@@ -72,7 +76,7 @@ class NASAAPI:
             else:
                 params['earth_date'] = datetime.now().strftime('%Y-%m-%d')
             
-            response = requests.get(
+            response = http_client.session('nasa').get(
                 f"{self.base_url}/mars-photos/api/v1/rovers/{rover}/photos",
                 params=params,
                 timeout=10
@@ -95,45 +99,211 @@ class NASAAPI:
             return self._error_response('api_key_missing', 'NASA API key is not configured')
         
         try:
-            images = []
-            today = datetime.now()
+            today = datetime.now().date()
+            days = max(min(count * 2, 30), 1)  # Try up to 30 days
+            start = today - timedelta(days=days - 1)
+            deadline = current_app.config.get('NASA_BACKGROUNDS_DEADLINE', 8)
             
-            # Fetch APOD from recent days
-            for i in range(min(count * 2, 30)):  # Try up to 30 days
-                if len(images) >= count:
-                    break
-                    
-                date = (today - timedelta(days=i)).strftime('%Y-%m-%d')
-                
-                params = {
-                    'api_key': self.api_key,
-                    'date': date
-                }
-                
-                try:
-                    response = requests.get(
-                        f"{self.base_url}/planetary/apod",
-                        params=params,
-                        timeout=10
-                    )
-                    
-                    if response.status_code == 200:
-                        apod = response.json()
-                        if apod.get('media_type') == 'image':
-                            images.append(apod)
-                            
-                except Exception:
-                    continue
+            # ─── Archived Past Days (single indexed range query) ─
+            archived = ApodEntry.query.filter(
+                ApodEntry.date >= start,
+                ApodEntry.date < today
+            ).all()
+            archived_dates = {entry.date for entry in archived}
+            apods = [entry.data for entry in archived]
+            
+            # ─── Fetch Whatever the Archive Is Missing ──────────
+            # Once backfilled this is only today's (cached) APOD
+            missing = [
+                start + timedelta(days=i) for i in range(days)
+                if start + timedelta(days=i) not in archived_dates
+            ]
+            wanted = count - sum(1 for apod in apods if apod.get('media_type') == 'image')
+            fetched, partial = self._fetch_apod_window(missing, wanted, deadline)
+            self._archive(fetched)
+            apods.extend(fetched)
+            
+            # Newest first, images only
+            apods = sorted(apods, key=lambda apod: apod.get('date', ''), reverse=True)
+            images = [apod for apod in apods if apod.get('media_type') == 'image'][:count]
             
             return {
                 'success': True,
-                'images': images
+                'images': images,
+                'partial': partial
             }
                 
         except Exception as e:
             current_app.logger.error(f"NASA backgrounds error: {str(e)}")
             return self._error_response('internal_error', 'Failed to fetch NASA backgrounds')
     
+    def backfill_archive(self, start, end, chunk_days=30):
+        # ═══════════════════════════════════════════════════════════════
+        # ────Preload the APOD archive for a date range (CLI/cron job)────
+        # ═══════════════════════════════════════════════════════════════
+        if not self.api_key:
+            raise RuntimeError('NASA API key is not configured')
+        
+        stored = 0
+        chunk_start = start
+        
+        while chunk_start <= end:
+            chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end)
+            
+            # Skip chunks that are already fully archived
+            archived = ApodEntry.query.filter(
+                ApodEntry.date >= chunk_start,
+                ApodEntry.date <= chunk_end
+            ).count()
+            
+            if archived < (chunk_end - chunk_start).days + 1:
+                # Straight to the archive: the response cache isn't needed
+                apods = self._request_apod_range(
+                    chunk_start.strftime('%Y-%m-%d'),
+                    chunk_end.strftime('%Y-%m-%d'),
+                    current_app.config.get('NASA_BACKFILL_TIMEOUT', 30)
+                )
+                stored += ApodEntry.store_many(apods)
+            
+            chunk_start = chunk_end + timedelta(days=1)
+        
+        return stored
+    
+    def _fetch_apod_window(self, dates, count, deadline):
+        # ═══════════════════════════════════════════════════════════════
+        # ──One range query for the dates, per-day fan-out as fallback───
+        # ═══════════════════════════════════════════════════════════════
+        if not dates:
+            return [], False
+        
+        dates = [date.strftime('%Y-%m-%d') for date in sorted(dates, reverse=True)]
+        started = time.monotonic()
+        
+        # `deadline` is the budget for every step together, not each
+        try:
+            apods = self._fetch_apod_range(dates[-1], dates[0])
+        except requests.exceptions.HTTPError as e:
+            if e.response is None or e.response.status_code != 400:
+                return self._fallback_window(dates, count, deadline, started, e)
+            
+            # NASA's APOD day (US Eastern) can lag our clock by hours:
+            # today isn't published yet, so end the range a day earlier
+            dates = dates[1:]
+            if not dates:
+                return [], False
+            if deadline - (time.monotonic() - started) < self._range_timeout():
+                return [], True
+            try:
+                apods = self._fetch_apod_range(dates[-1], dates[0])
+            except requests.exceptions.HTTPError as e:
+                # Still a bad request: fetching each day would fail too
+                current_app.logger.warning(f"NASA range query rejected: {str(e)}")
+                return [], True
+            except Exception as e:
+                return self._fallback_window(dates, count, deadline, started, e)
+        except Exception as e:
+            return self._fallback_window(dates, count, deadline, started, e)
+        
+        wanted = set(dates)
+        return [apod for apod in apods if apod.get('date') in wanted], False
+    
+    def _fallback_window(self, dates, count, deadline, started, error):
+        # ─── Per-day fan-out with whatever budget the range query left ─
+        remaining = deadline - (time.monotonic() - started)
+        if remaining <= 0:
+            current_app.logger.warning(f"NASA range query failed with no time left: {str(error)}")
+            return [], True
+        current_app.logger.warning(f"NASA range query failed, falling back to per-day fetch: {str(error)}")
+        return self._fetch_apods_parallel(dates, count, remaining)
+    
+    def _fetch_apods_parallel(self, dates, count, deadline):
+        # ═══════════════════════════════════════════════════════════════
+        # ──Bounded per-day fan-out; returns (apods, hit_deadline) pair──
+        # ═══════════════════════════════════════════════════════════════
+        workers = current_app.config.get('NASA_BACKGROUNDS_WORKERS', 6)
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = [executor.submit(self._fetch_apod, date) for date in dates]
+        apods = []
+        images = 0
+        
+        try:
+            for future in as_completed(futures, timeout=deadline):
+                try:
+                    apod = future.result()
+                except Exception:
+                    continue
+                
+                apods.append(apod)
+                if apod.get('media_type') == 'image':
+                    images += 1
+                if images >= count:
+                    break
+            return apods, False
+        
+        except FuturesTimeout:
+            current_app.logger.warning(f"NASA backgrounds deadline hit after {deadline:.1f}s, returning {len(apods)} results")
+            return apods, True
+        
+        finally:
+            # Don't block the request on stragglers; completed ones are cached
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _archived_apod(self, date):
+        # ─── Past APODs never change, so the archive is authoritative ─
+        if not date:
+            return None
+        try:
+            entry = db.session.get(ApodEntry, datetime.strptime(date, '%Y-%m-%d').date())
+        except ValueError:
+            return None
+        return entry.data if entry else None
+    
+    def _archive(self, apods):
+        try:
+            ApodEntry.store_many(apods)
+        except Exception as e:
+            current_app.logger.error(f"APOD archive error: {str(e)}")
+    
+    @cached('nasa')
+    def _fetch_apod(self, date=None):
+        # ─── Upstream Call (raises on failure, cached on success) ─
+        params = {'api_key': self.api_key}
+        if date:
+            params['date'] = date
+        
+        response = http_client.session('nasa').get(
+            f"{self.base_url}/planetary/apod",
+            params=params,
+            timeout=10
+        )
+        response.raise_for_status()
+        return response.json()
+    
+    @cached('nasa')
+    def _fetch_apod_range(self, start_date, end_date):
+        # Keyed by the dates only: the timeout is config, not identity
+        return self._request_apod_range(start_date, end_date, self._range_timeout())
+    
+    def _range_timeout(self):
+        # Never longer than the whole backgrounds budget
+        return min(
+            current_app.config.get('NASA_RANGE_TIMEOUT', 4),
+            current_app.config.get('NASA_BACKGROUNDS_DEADLINE', 8)
+        )
+    
+    def _request_apod_range(self, start_date, end_date, timeout):
+        response = http_client.session('nasa').get(
+            f"{self.base_url}/planetary/apod",
+            params={
+                'api_key': self.api_key,
+                'start_date': start_date,
+                'end_date': end_date
+            },
+            timeout=timeout
+        )
+        response.raise_for_status()
+        return response.json()
+    
     def _error_response(self, error_code, message):
         # ═══════════════════════════════════════════════════════════════
         # ────────Helper to create consistent error responses────────────
@@ -144,4 +314,5 @@ class NASAAPI:
         }
 
 # ─── Singleton Instance ────────────────────────────────────────
-nasa_api = NASAAPI()
\ No newline at end of file
+nasa_api = NASAAPI()
+async_nasa_api = AsyncService(nasa_api)
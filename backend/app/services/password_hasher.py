@@ -0,0 +1,163 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from werkzeug.security import (
+    DEFAULT_PBKDF2_ITERATIONS, check_password_hash, generate_password_hash
+)
+
+# ═══════════════════════════════════════════════════════════════
+# Password Hashing Service
+# ═══════════════════════════════════════════════════════════════
+#
+# scrypt/pbkdf2 are deliberately CPU-heavy. Hashing runs on a small
+# per-process pool of worker processes (PASSWORD_HASH_WORKERS, 0 =
+# inline) so a login storm is capped at that many busy cores instead
+# of pinning every request thread. At most PASSWORD_HASH_MAX_PENDING
+# hashes wait for a worker; past that the caller gets
+# HasherBusyError (503) rather than an ever-growing queue.
+#
+# PASSWORD_HASH_METHOD takes werkzeug's method strings, e.g.
+#   scrypt:32768:8:1   (werkzeug's default)
+#   pbkdf2:sha256:1000000
+# Stored hashes made with any other method/cost still verify, and
+# are upgraded on the user's next successful login (needs_rehash).
+
+
+class HasherBusyError(Exception):
+    # ─── Every worker busy and the wait queue is full ───────────
+    pass
+
+
+def canonical_method(method):
+    # ═══════════════════════════════════════════════════════════════
+    # ───Spell out werkzeug's defaults: "scrypt" → "scrypt:32768:8:1"─
+    # ═══════════════════════════════════════════════════════════════
+    name, *args = method.split(':')
+    if name == 'scrypt':
+        n, r, p = args or (2 ** 15, 8, 1)
+        return f"scrypt:{int(n)}:{int(r)}:{int(p)}"
+    if name == 'pbkdf2':
+        hash_name = args[0] if args else 'sha256'
+        iterations = args[1] if len(args) > 1 else DEFAULT_PBKDF2_ITERATIONS
+        return f"pbkdf2:{hash_name}:{int(iterations)}"
+    raise ValueError(f"Unsupported password hash method '{method}'")
+
+
+def _hash(password, method):
+    # Module-level so worker processes can import it
+    return generate_password_hash(password, method=method)
+
+
+def _verify(stored_hash, password):
+    return check_password_hash(stored_hash, password)
+
+
+def _noop():
+    return None
+
+
+class PasswordHasher:
+    # ═══════════════════════════════════════════════════════════════
+    # ────Bounded process pool for hashing and verifying passwords───
+    # ═══════════════════════════════════════════════════════════════
+    def __init__(self):
+        self.method = canonical_method('scrypt')
+        self.max_workers = 0
+        self.max_pending = 0
+        self.queue_timeout = 5
+        self._executor = None
+        self._pid = None
+        self._slots = threading.BoundedSemaphore(1)
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        workers = app.config.get('PASSWORD_HASH_WORKERS')
+        self.configure(
+            method=app.config.get('PASSWORD_HASH_METHOD', 'scrypt'),
+            workers=(os.cpu_count() or 1) if workers is None else workers,
+            max_pending=app.config.get('PASSWORD_HASH_MAX_PENDING'),
+            queue_timeout=app.config.get('PASSWORD_HASH_QUEUE_TIMEOUT', self.queue_timeout)
+        )
+        app.extensions['password_hasher'] = self
+
+        # Off the boot path: workers are ready by the first login
+        if app.config.get('PASSWORD_HASH_WARM', True):
+            threading.Thread(target=self._warm_quietly, name='hasher-warm', daemon=True).start()
+
+    def _warm_quietly(self):
+        try:
+            self.warm()
+        except Exception:
+            pass  # The first hash starts the pool instead
+
+    def configure(self, method, workers, max_pending=None, queue_timeout=5):
+        self.method = canonical_method(method)
+        self.max_workers = workers
+        self.max_pending = max_pending or workers * 4
+        self.queue_timeout = queue_timeout
+
+        # Workers plus queued jobs; one slot per in-flight hash
+        self._slots = threading.BoundedSemaphore(max(self.max_workers + self.max_pending, 1))
+
+    def _pool(self):
+        with self._lock:
+            # gunicorn forks after import: each worker needs its own pool.
+            # Workers come from a forkserver, never a fork of this
+            # multi-threaded process, so no lock can be inherited held
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('forkserver')
+                )
+                self._pid = os.getpid()
+            return self._executor
+
+    def warm(self):
+        # ─── Start every worker now, not on the first login ─────────
+        # Entry scripts are re-imported in each worker; don't recurse
+        if not self.max_workers or multiprocessing.parent_process() is not None:
+            return
+        pool = self._pool()
+        for future in [pool.submit(_noop) for _ in range(self.max_workers)]:
+            future.result()
+
+    def _run(self, func, *args):
+        if not self.max_workers:
+            return func(*args)
+
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise HasherBusyError("Password hashing queue is full")
+        try:
+            # The request thread only waits here; the CPU work is elsewhere
+            return self._pool().submit(func, *args).result()
+        finally:
+            self._slots.release()
+
+    # ─── Public API ───────────────────────────────────────────
+
+    def hash(self, password, method=None):
+        return self._run(_hash, password, method or self.method)
+
+    def verify(self, stored_hash, password):
+        if not stored_hash:
+            return False
+        return self._run(_verify, stored_hash, password)
+
+    def needs_rehash(self, stored_hash):
+        # True when the stored hash used another method or cost
+        stored_method = stored_hash.split('$', 1)[0]
+        try:
+            return canonical_method(stored_method) != self.method
+        except ValueError:
+            return True
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+
+# ─── Singleton Instance ────────────────────────────────────────
+password_hasher = PasswordHasher()
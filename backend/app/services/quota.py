@@ -0,0 +1,256 @@
+import contextvars
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+import requests
+
+# ═══════════════════════════════════════════════════════════════
+# Upstream Quota Manager
+# ═══════════════════════════════════════════════════════════════
+#
+# NASA and weatherstack meter usage per API key, so every upstream
+# call to a provider listed in UPSTREAM_QUOTAS takes a token from
+# that provider's bucket (refilled continuously at limit / period).
+#
+#   memory  → per-process buckets
+#   sqlite  → file-backed buckets shared by all gunicorn workers
+#
+# Background work (cache revalidation, archive backfills) runs with
+# background priority and may not dip into the last
+# QUOTA_BACKGROUND_RESERVE share of a bucket, which is kept for
+# interactive requests. An exhausted bucket raises QuotaExceededError,
+# a requests ConnectionError, so existing service fallbacks apply.
+
+INTERACTIVE = 'interactive'
+BACKGROUND = 'background'
+
+upstream_priority = contextvars.ContextVar('upstream_priority', default=INTERACTIVE)
+
+
+@contextmanager
+def background_priority():
+    # ─── Mark upstream calls made inside the block as background ─
+    token = upstream_priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        upstream_priority.reset(token)
+
+
+class QuotaExceededError(requests.exceptions.ConnectionError):
+    # Raised instead of calling a provider whose budget is used up
+    pass
+
+
+def refill(tokens, updated_at, now, limit, period):
+    # Tokens accrue continuously, capped at the bucket size
+    return min(float(limit), tokens + (now - updated_at) * limit / period)
+
+
+class MemoryQuotaStore:
+    # ═══════════════════════════════════════════════════════════════
+    # ─────────────────In-process token buckets──────────────────────
+    # ═══════════════════════════════════════════════════════════════
+    name = 'memory'
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def take(self, name, limit, period, cost, floor):
+        # Returns (granted, tokens left)
+        with self._lock:
+            now = time.time()
+            bucket = self._buckets.setdefault(
+                name, {'tokens': float(limit), 'updated_at': now, 'used': 0, 'rejected': 0}
+            )
+            tokens = refill(bucket['tokens'], bucket['updated_at'], now, limit, period)
+            granted = tokens - cost >= floor
+
+            if granted:
+                tokens -= cost
+                bucket['used'] += cost
+            else:
+                bucket['rejected'] += 1
+
+            bucket['tokens'], bucket['updated_at'] = tokens, now
+            return granted, tokens
+
+    def refund(self, name, cost):
+        with self._lock:
+            bucket = self._buckets.get(name)
+            if bucket is not None:
+                bucket['tokens'] += cost
+                bucket['used'] -= cost
+
+    def snapshot(self, name, limit, period):
+        with self._lock:
+            bucket = self._buckets.get(name)
+            if bucket is None:
+                return float(limit), 0, 0
+            tokens = refill(bucket['tokens'], bucket['updated_at'], time.time(), limit, period)
+            return tokens, bucket['used'], bucket['rejected']
+
+
+class SQLiteQuotaStore:
+    # ═══════════════════════════════════════════════════════════════
+    # ──────File-backed token buckets shared across worker processes─
+    # ═══════════════════════════════════════════════════════════════
+    name = 'sqlite'
+
+    def __init__(self, path):
+        # Nothing touches the disk until the first metered call
+        self.path = path
+        self._local = threading.local()
+
+    def _connection(self):
+        # One connection per thread; sqlite3 connections are not thread-safe
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS quota_buckets ("
+                " name TEXT PRIMARY KEY,"
+                " tokens REAL NOT NULL,"
+                " updated_at REAL NOT NULL,"
+                " used INTEGER NOT NULL DEFAULT 0,"
+                " rejected INTEGER NOT NULL DEFAULT 0)"
+            )
+            self._local.conn = conn
+        return conn
+
+    def take(self, name, limit, period, cost, floor):
+        conn = self._connection()
+        now = time.time()
+
+        # IMMEDIATE takes the write lock up front: read-refill-write is atomic
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM quota_buckets WHERE name = ?", (name,)
+            ).fetchone()
+            tokens = float(limit) if row is None else refill(row[0], row[1], now, limit, period)
+            granted = tokens - cost >= floor
+            if granted:
+                tokens -= cost
+
+            conn.execute(
+                "INSERT INTO quota_buckets (name, tokens, updated_at, used, rejected) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET tokens = excluded.tokens, "
+                "updated_at = excluded.updated_at, "
+                "used = used + excluded.used, rejected = rejected + excluded.rejected",
+                (name, tokens, now, cost if granted else 0, 0 if granted else 1)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        return granted, tokens
+
+    def refund(self, name, cost):
+        self._connection().execute(
+            "UPDATE quota_buckets SET tokens = tokens + ?, used = used - ? WHERE name = ?",
+            (cost, cost, name)
+        )
+
+    def snapshot(self, name, limit, period):
+        row = self._connection().execute(
+            "SELECT tokens, updated_at, used, rejected FROM quota_buckets WHERE name = ?", (name,)
+        ).fetchone()
+        if row is None:
+            return float(limit), 0, 0
+        return refill(row[0], row[1], time.time(), limit, period), row[2], row[3]
+
+
+class QuotaManager:
+    # ═══════════════════════════════════════════════════════════════
+    # ──────Per-provider call budgets with background reservation────
+    # ═══════════════════════════════════════════════════════════════
+    def __init__(self):
+        self.store = MemoryQuotaStore()
+        self.enabled = True
+        self.quotas = {}
+        self.background_reserve = 0.25
+
+    def init_app(self, app):
+        # ─── Select Store ───────────────────────────────────────
+        if app.config.get('QUOTA_BACKEND', 'memory') == 'sqlite':
+            path = app.config.get('QUOTA_SQLITE_PATH') or os.path.join(
+                app.instance_path, 'upstream_quota.db'
+            )
+            self.store = SQLiteQuotaStore(path)
+        else:
+            self.store = MemoryQuotaStore()
+
+        self.enabled = app.config.get('QUOTA_ENABLED', True)
+        self.quotas = dict(app.config.get('UPSTREAM_QUOTAS', {}))
+        self.background_reserve = app.config.get('QUOTA_BACKGROUND_RESERVE', self.background_reserve)
+
+        app.extensions['quota_manager'] = self
+
+    def acquire(self, provider, cost=1):
+        # ═══════════════════════════════════════════════════════════════
+        # ────Take tokens for one upstream call or raise when exhausted──
+        # ═══════════════════════════════════════════════════════════════
+        quota = self.quotas.get(provider)
+        if not self.enabled or quota is None:
+            return False
+
+        limit, period = quota['limit'], quota['period']
+        priority = upstream_priority.get()
+        floor = limit * self.background_reserve if priority == BACKGROUND else 0
+
+        granted, tokens = self.store.take(provider, limit, period, cost, floor)
+        if not granted:
+            raise QuotaExceededError(
+                f"{provider} quota exhausted for {priority} calls ({tokens:.1f}/{limit} left)"
+            )
+        return True
+
+    def charge(self, provider, cost):
+        # Extra upstream attempts (adapter retries) of an accepted call
+        quota = self.quotas.get(provider)
+        if self.enabled and quota is not None and cost > 0:
+            self.store.take(provider, quota['limit'], quota['period'], cost, float('-inf'))
+
+    def refund(self, provider, cost=1):
+        # A call that took a token but never left the process
+        if self.enabled and provider in self.quotas:
+            self.store.refund(provider, cost)
+
+    def stats(self):
+        # ═══════════════════════════════════════════════════════════════
+        # ─────────────Remaining budget per metered provider─────────────
+        # ═══════════════════════════════════════════════════════════════
+        providers = {}
+        for provider, quota in self.quotas.items():
+            limit, period = quota['limit'], quota['period']
+            tokens, used, rejected = self.store.snapshot(provider, limit, period)
+            providers[provider] = {
+                'limit': limit,
+                'period_seconds': period,
+                'remaining': round(max(tokens, 0), 2),
+                'background_floor': round(limit * self.background_reserve, 2),
+                'used': used,
+                'rejected': rejected
+            }
+
+        return {
+            'backend': self.store.name,
+            'enabled': self.enabled,
+            'background_reserve': self.background_reserve,
+            'providers': providers
+        }
+
+
+# ─── Singleton Instance ────────────────────────────────────────
+quota_manager = QuotaManager()
@@ -0,0 +1,222 @@
+import math
+import os
+import sqlite3
+import threading
+import time
+from flask import g, jsonify, request
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+
+# ═══════════════════════════════════════════════════════════════
+# Inbound Rate Limiter
+# ═══════════════════════════════════════════════════════════════
+#
+# Requests to blueprints listed in RATE_LIMITS are counted per client
+# (JWT identity when a valid token is sent, otherwise the client IP,
+# which ProxyFix recovers from X-Forwarded-For behind the proxy) with
+# a sliding-window counter: the previous fixed window's count,
+# weighted by how much of it still overlaps the sliding window, plus
+# the current window's count.
+#
+#   memory  → per-process counters (default)
+#   sqlite  → file-backed counters shared by all gunicorn workers
+#
+# Over the limit → 429 with Retry-After, before the view runs.
+
+
+def sliding_estimate(previous, current, elapsed, window):
+    return previous * (1 - elapsed / window) + current
+
+
+def retry_after(previous, current, elapsed, limit, window):
+    # Seconds until one more request fits under the limit
+    if current >= limit or previous <= 0:
+        return max(math.ceil(window - elapsed), 1)
+    # previous * (1 - t / window) + current <= limit - 1
+    target = window * (1 - (limit - 1 - current) / previous)
+    return max(math.ceil(target - elapsed), 1)
+
+
+class MemoryRateStore:
+    # ═══════════════════════════════════════════════════════════════
+    # ───────────────In-process fixed-window counters────────────────
+    # ═══════════════════════════════════════════════════════════════
+    name = 'memory'
+
+    def __init__(self):
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def hit(self, key, limit, window):
+        # Returns (allowed, previous count, current count, elapsed)
+        now = time.time()
+        start = int(now // window * window)
+        elapsed = now - start
+
+        with self._lock:
+            previous = self._counts.get((key, start - window), 0)
+            current = self._counts.get((key, start), 0)
+
+            allowed = sliding_estimate(previous, current, elapsed, window) < limit
+            if allowed:
+                current += 1
+                self._counts[(key, start)] = current
+
+            # Windows older than the previous one can never be read again
+            if len(self._counts) > 10000:
+                self._counts = {
+                    (k, s): c for (k, s), c in self._counts.items() if s >= start - window
+                }
+
+        return allowed, previous, current, elapsed
+
+
+class SQLiteRateStore:
+    # ═══════════════════════════════════════════════════════════════
+    # ─────File-backed counters shared across worker processes───────
+    # ═══════════════════════════════════════════════════════════════
+    name = 'sqlite'
+
+    PRUNE_EVERY = 256  # Hits between sweeps of expired windows
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._hits = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS rate_counters ("
+            " key TEXT NOT NULL,"
+            " window_start INTEGER NOT NULL,"
+            " window INTEGER NOT NULL,"
+            " count INTEGER NOT NULL,"
+            " PRIMARY KEY (key, window_start))"
+        )
+
+    def _connection(self):
+        # One connection per thread; sqlite3 connections are not thread-safe
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def hit(self, key, limit, window):
+        conn = self._connection()
+        now = time.time()
+        start = int(now // window * window)
+        elapsed = now - start
+
+        # IMMEDIATE takes the write lock up front: check-and-count is atomic
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            counts = dict(conn.execute(
+                "SELECT window_start, count FROM rate_counters "
+                "WHERE key = ? AND window_start IN (?, ?)",
+                (key, start - window, start)
+            ).fetchall())
+            previous = counts.get(start - window, 0)
+            current = counts.get(start, 0)
+
+            allowed = sliding_estimate(previous, current, elapsed, window) < limit
+            if allowed:
+                current += 1
+                conn.execute(
+                    "INSERT INTO rate_counters (key, window_start, window, count) VALUES (?, ?, ?, 1) "
+                    "ON CONFLICT(key, window_start) DO UPDATE SET count = count + 1",
+                    (key, start, window)
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        self._hits += 1
+        if not self._hits % self.PRUNE_EVERY:
+            conn.execute("DELETE FROM rate_counters WHERE window_start + 2 * window < ?", (now,))
+
+        return allowed, previous, current, elapsed
+
+
+class RateLimiter:
+    # ═══════════════════════════════════════════════════════════════
+    # ─────Per-blueprint request limits keyed by user or client IP───
+    # ═══════════════════════════════════════════════════════════════
+    def __init__(self):
+        self.store = MemoryRateStore()
+        self.enabled = True
+        self.limits = {}
+
+    def init_app(self, app):
+        # ─── Select Store ───────────────────────────────────────
+        if app.config.get('RATE_LIMIT_BACKEND', 'memory') == 'sqlite':
+            path = app.config.get('RATE_LIMIT_SQLITE_PATH') or os.path.join(
+                app.instance_path, 'rate_limits.db'
+            )
+            self.store = SQLiteRateStore(path)
+        else:
+            self.store = MemoryRateStore()
+
+        self.enabled = app.config.get('RATE_LIMIT_ENABLED', True)
+        self.limits = dict(app.config.get('RATE_LIMITS', {}))
+
+        app.before_request(self.check)
+        app.after_request(self.add_headers)
+        app.extensions['rate_limiter'] = self
+
+    def client_key(self):
+        # ─── JWT identity when a valid token is sent, else the IP ─
+        try:
+            verify_jwt_in_request(optional=True)
+            identity = get_jwt_identity()
+        except Exception:
+            # Expired/invalid tokens are rejected by the view itself
+            identity = None
+
+        if identity is not None:
+            return f"user:{identity}"
+        return f"ip:{request.remote_addr or 'unknown'}"
+
+    def check(self):
+        # ═══════════════════════════════════════════════════════════════
+        # ─────────before_request: count the call or answer 429──────────
+        # ═══════════════════════════════════════════════════════════════
+        rule = self.limits.get(request.blueprint)
+        if not self.enabled or rule is None or request.method == 'OPTIONS':
+            return None
+
+        limit, window = rule['limit'], rule['window']
+        key = f"{request.blueprint}:{self.client_key()}"
+        allowed, previous, current, elapsed = self.store.hit(key, limit, window)
+
+        remaining = limit - sliding_estimate(previous, current, elapsed, window)
+        g.rate_limit = (limit, max(int(remaining), 0))
+
+        if allowed:
+            return None
+
+        wait = retry_after(previous, current, elapsed, limit, window)
+        response = jsonify({
+            "success": False,
+            "error": "rate_limited",
+            "message": f"Too many requests. Try again in {wait} seconds."
+        })
+        response.status_code = 429
+        response.headers['Retry-After'] = str(wait)
+        return response
+
+    def add_headers(self, response):
+        rate_limit = g.pop('rate_limit', None)
+        if rate_limit is not None:
+            response.headers['X-RateLimit-Limit'] = str(rate_limit[0])
+            response.headers['X-RateLimit-Remaining'] = str(rate_limit[1])
+        return response
+
+
+# ─── Singleton Instance ────────────────────────────────────────
+rate_limiter = RateLimiter()
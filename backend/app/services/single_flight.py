@@ -0,0 +1,115 @@
+import copy
+import os
+import threading
+
+# ═══════════════════════════════════════════════════════════════
+# Upstream Request Coalescing (Single-flight)
+# ═══════════════════════════════════════════════════════════════
+#
+# When several threads of a worker miss the cache for the same key
+# at once, only the first (the leader) calls upstream; the rest wait
+# for its result or exception instead of firing duplicate requests.
+# Used by @cached, so the key is the cache key: namespace, function
+# and normalized arguments. Coalescing is per process.
+
+
+class _Call:
+    # One in-flight upstream call and the outcome its followers share
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    # ═══════════════════════════════════════════════════════════════
+    # ─────────Share one in-flight call between identical callers────
+    # ═══════════════════════════════════════════════════════════════
+    def __init__(self):
+        self.enabled = True
+        self.wait_timeout = 30       # Seconds a follower waits before calling itself
+        self._calls = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.enabled = app.config.get('SINGLE_FLIGHT_ENABLED', self.enabled)
+        self.wait_timeout = app.config.get('SINGLE_FLIGHT_WAIT', self.wait_timeout)
+        app.extensions['single_flight'] = self
+
+    def do(self, namespace, key, fn):
+        # ═══════════════════════════════════════════════════════════════
+        # ──Run fn() once per key at a time; followers get its outcome───
+        # ═══════════════════════════════════════════════════════════════
+        if not self.enabled:
+            return fn()
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        # ─── Leader: Make the Upstream Call ─────────────────────
+        if leader:
+            self._count(namespace, 'leaders')
+            try:
+                result = fn()
+                # Publish a private snapshot: the leader may mutate its own copy
+                call.result = copy.deepcopy(result)
+                return result
+            except Exception as e:
+                call.error = e
+                raise
+            finally:
+                with self._lock:
+                    self._calls.pop(key, None)
+                call.done.set()
+
+        # ─── Follower: Wait for the Leader's Outcome ────────────
+        self._count(namespace, 'collapsed')
+        if not call.done.wait(self.wait_timeout):
+            self._count(namespace, 'timeouts')
+            return fn()
+
+        if call.error is not None:
+            raise call.error
+
+        # Each follower gets its own copy of the snapshot
+        return copy.deepcopy(call.result)
+
+    def _count(self, namespace, counter):
+        with self._lock:
+            counters = self._counters.setdefault(
+                namespace, {'leaders': 0, 'collapsed': 0, 'timeouts': 0}
+            )
+            counters[counter] += 1
+
+    def stats(self):
+        # ═══════════════════════════════════════════════════════════════
+        # ─────────Upstream calls made vs. calls collapsed into them─────
+        # ═══════════════════════════════════════════════════════════════
+        with self._lock:
+            namespaces = {name: dict(counters) for name, counters in self._counters.items()}
+            in_flight = len(self._calls)
+
+        totals = {'leaders': 0, 'collapsed': 0, 'timeouts': 0}
+        for counters in namespaces.values():
+            for counter, value in counters.items():
+                totals[counter] += value
+
+        calls = totals['leaders'] + totals['collapsed']
+        totals['collapse_rate'] = round(totals['collapsed'] / calls, 4) if calls else 0.0
+
+        return {
+            'enabled': self.enabled,
+            'pid': os.getpid(),
+            'in_flight': in_flight,
+            'wait_timeout': self.wait_timeout,
+            'totals': totals,
+            'namespaces': namespaces
+        }
+
+
+# ─── Singleton Instance ────────────────────────────────────────
+single_flight = SingleFlight()
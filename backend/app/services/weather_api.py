@@ -1,10 +1,49 @@
 import requests
 import os
+import re
 from flask import current_app
+from app.services.async_client import AsyncService
+from app.services.cache import _MISSING, response_cache
+from app.services.http_client import http_client
+from app.services.single_flight import single_flight
 
 # ═══════════════════════════════════════════════════════════════
 # WeatherStack API Service
 # ═══════════════════════════════════════════════════════════════
+#
+# Current conditions are cached per resolved place (the name, region
+# and country of the response's location block), not per query
+# string. Each normalized query is remembered as an alias of the
+# place it resolved to, so "London" and "london, uk" share one
+# upstream call per TTL. Coordinate queries go through a secondary
+# index keyed by geo bucket (lat/lon rounded to WEATHER_GEO_PRECISION
+# decimals) that points at a place; a name query only ever reads the
+# place it resolved to itself.
+
+_COORDINATES = re.compile(r'^(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)$')
+
+def normalize_location(city):
+    # ─── "  New  York ,US." → "new york, us" ───────────────────
+    text = re.sub(r'\s+', ' ', (city or '').strip().lower())
+    text = re.sub(r'\s*,\s*', ', ', text)
+    return text.strip(' .,;')
+
+def geo_bucket(lat, lon, precision=1):
+    # Returns "51.5,-0.1" or None when the coordinates are unusable
+    try:
+        return f"{round(float(lat), precision):.{precision}f},{round(float(lon), precision):.{precision}f}"
+    except (TypeError, ValueError):
+        return None
+
+def location_key(location):
+    # ─── Identity of a resolved place, or None ──────────────────
+    # "London" / "City of London, Greater London" / "United Kingdom"
+    parts = [normalize_location(str(location.get(field) or '')) for field in ('name', 'region', 'country')]
+    if any(parts):
+        return '|'.join(parts)
+    if location.get('lat') and location.get('lon'):
+        return f"{location['lat']},{location['lon']}"
+    return None
 
 class WeatherAPI:
     # ═══════════════════════════════════════════════════════════════
@@ -30,41 +69,31 @@ class WeatherAPI:
         
         # ─── Make API Request ───────────────────────────────────
         try:
-            response = requests.get(
-                f"{self.base_url}/current",
-                params={
-                    "access_key": self.api_key,
-                    "query": city,
-                    "units": "m"  # Metric units
-                },
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Check for API error
-                if 'error' in data:
-                    error_code = data['error'].get('code', 'unknown')
-                    
-                    if '404' in str(error_code):
-                        return self._error_response(
-                            'location_not_found',
-                            f"Could not find weather data for '{city}'"
-                        )
-                    
+            data = self._cached_current(city)
+
+            # Check for API error
+            if 'error' in data:
+                error_code = data['error'].get('code', 'unknown')
+
+                if '404' in str(error_code):
                     return self._error_response(
-                        'api_error',
-                        data['error'].get('info', 'Weather service error')
+                        'location_not_found',
+                        f"Could not find weather data for '{city}'"
                     )
-                
-                # Format city name
-                if 'location' in data and 'name' in data['location']:
-                    data['location']['name'] = data['location']['name'].title()
-                
-                return data
-            
-            current_app.logger.error(f"Weather API error: {response.status_code}")
+
+                return self._error_response(
+                    'api_error',
+                    data['error'].get('info', 'Weather service error')
+                )
+
+            # Format city name
+            if 'location' in data and 'name' in data['location']:
+                data['location']['name'] = data['location']['name'].title()
+
+            return data
+
+        except requests.exceptions.HTTPError as e:
+            current_app.logger.error(f"Weather API error: {e.response.status_code}")
             return self._error_response(
                 'api_unavailable',
                 'Weather service is currently unavailable'
@@ -91,6 +120,81 @@ class WeatherAPI:
                 'Failed to fetch weather data'
             )
     
+    def _cached_current(self, city):
+        # ═══════════════════════════════════════════════════════════════
+        # ──Serve the query's geo bucket from cache, else fetch once─────
+        # ═══════════════════════════════════════════════════════════════
+        query = normalize_location(city)
+        precision = current_app.config.get('WEATHER_GEO_PRECISION', 1)
+
+        # Names resolve through learned aliases, coordinates via their bucket
+        coordinates = _COORDINATES.match(query)
+        if coordinates:
+            bucket = geo_bucket(*coordinates.groups(), precision)
+            index_key = f"weather_geo:{bucket}" if bucket else None
+        else:
+            index_key = f"weather_alias:{query}"
+
+        place = None
+        if index_key:
+            alias = response_cache.get('weather_alias', index_key)
+            place = alias[0] if alias is not _MISSING else None
+
+        if place:
+            entry = response_cache.get('weather', f"weather:current:{place}")
+            if entry is not _MISSING:
+                data, is_stale = entry
+                if is_stale:
+                    response_cache.revalidate(
+                        'weather', f"weather:current:{place}",
+                        lambda: self._refresh_current(query, precision)
+                    )
+                return data
+
+        # Concurrent first lookups for the same query share one call
+        return single_flight.do(
+            'weather', f"weather:query:{query}",
+            lambda: self._refresh_current(query, precision)
+        )
+
+    def _refresh_current(self, query, precision):
+        # ─── Fetch, store under the place, then index the query ─────
+        data = self._fetch_current(query)
+        if 'error' in data:
+            return data  # Never cached
+
+        location = data.get('location') or {}
+        place = location_key(location)
+        if not place:
+            return data
+
+        response_cache.set('weather', f"weather:current:{place}", data)
+        response_cache.set('weather_alias', f"weather_alias:{query}", place)
+
+        # Coordinate lookups use the bucket of the query's own coordinates,
+        # which may differ from the bucket of the place they resolved to
+        buckets = {geo_bucket(location.get('lat'), location.get('lon'), precision)}
+        coordinates = _COORDINATES.match(query)
+        if coordinates:
+            buckets.add(geo_bucket(*coordinates.groups(), precision))
+        for bucket in buckets - {None}:
+            response_cache.set('weather_alias', f"weather_geo:{bucket}", place)
+        return data
+
+    def _fetch_current(self, city):
+        # ─── Upstream Call (raises on failure) ───────────────────
+        response = http_client.session('weather').get(
+            f"{self.base_url}/current",
+            params={
+                "access_key": self.api_key,
+                "query": city,
+                "units": "m"  # Metric units
+            },
+            timeout=10
+        )
+        response.raise_for_status()
+        return response.json()
+    
     def _error_response(self, error_code, message):
         # ═══════════════════════════════════════════════════════════════
         # ────────Helper to create consistent error responses────────────
@@ -101,4 +205,5 @@ class WeatherAPI:
         }
 
 # ─── Singleton Instance ────────────────────────────────────────
-weather_api = WeatherAPI()
\ No newline at end of file
+weather_api = WeatherAPI()
+async_weather_api = AsyncService(weather_api)
@@ -51,6 +51,20 @@ def get_metadata():
     return target_db.metadata
 
 
+# Schema objects created by raw SQL in migrations, invisible to the
+# models: without this, autogenerate would emit drops for them
+UNMANAGED_TABLE_PREFIXES = ('saved_items_fts',)  # SQLite FTS5 table + shadow tables
+UNMANAGED_INDEXES = ('ix_saved_items_search',)   # Postgres tsvector GIN index
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ == 'table' and name.startswith(UNMANAGED_TABLE_PREFIXES):
+        return False
+    if type_ == 'index' and name in UNMANAGED_INDEXES:
+        return False
+    return True
+
+
 def run_migrations_offline():
     """Run migrations in 'offline' mode.
 
@@ -93,6 +107,7 @@ def run_migrations_online():
     conf_args = current_app.extensions['migrate'].configure_args
     if conf_args.get("process_revision_directives") is None:
         conf_args["process_revision_directives"] = process_revision_directives
+    conf_args.setdefault("include_object", include_object)
 
     connectable = get_engine()
 
@@ -0,0 +1,82 @@
+"""add saved items search index
+
+Revision ID: 5e0b7a3c9d16
+Revises: c4a91e6f2d58
+Create Date: 2026-10-17 15:12:09.418265
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e0b7a3c9d16'
+down_revision = 'c4a91e6f2d58'
+branch_labels = None
+depends_on = None
+
+
+# Frozen copy of app.services.content_search.METADATA_FIELDS
+METADATA_FIELDS = (
+    'author', 'artist', 'category', 'area', 'glass',
+    'ingredients', 'subjects', 'medium', 'location', 'mood'
+)
+
+
+def sqlite_metadata(row):
+    return " || ' ' || ".join(
+        f"coalesce(json_extract({row}.item_metadata, '$.{field}'), '')" for field in METADATA_FIELDS
+    )
+
+
+def pg_document():
+    return (
+        "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english'::regconfig, coalesce(user_notes, '')), 'B') || "
+        "setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'C') || "
+        "setweight(to_tsvector('english'::regconfig, " + " || ' ' || ".join(
+            f"coalesce(item_metadata->>'{field}', '')" for field in METADATA_FIELDS
+        ) + "), 'D')"
+    )
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE saved_items_fts USING fts5("
+            "title, description, user_notes, metadata, tokenize = 'porter unicode61')"
+        )
+
+        insert = (
+            "INSERT INTO saved_items_fts (rowid, title, description, user_notes, metadata) "
+            "VALUES (new.id, new.title, new.description, new.user_notes, {metadata}); "
+        ).format(metadata=sqlite_metadata('new'))
+        delete = "DELETE FROM saved_items_fts WHERE rowid = old.id; "
+
+        op.execute(f"CREATE TRIGGER saved_items_fts_insert AFTER INSERT ON saved_items BEGIN {insert}END")
+        op.execute(f"CREATE TRIGGER saved_items_fts_delete AFTER DELETE ON saved_items BEGIN {delete}END")
+        op.execute(f"CREATE TRIGGER saved_items_fts_update AFTER UPDATE ON saved_items BEGIN {delete}{insert}END")
+
+        # Index rows saved before this migration
+        op.execute(
+            "INSERT INTO saved_items_fts (rowid, title, description, user_notes, metadata) "
+            f"SELECT id, title, description, user_notes, {sqlite_metadata('saved_items')} FROM saved_items"
+        )
+
+    elif dialect == 'postgresql':
+        op.execute(f"CREATE INDEX ix_saved_items_search ON saved_items USING gin (({pg_document()}))")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS saved_items_fts_update")
+        op.execute("DROP TRIGGER IF EXISTS saved_items_fts_delete")
+        op.execute("DROP TRIGGER IF EXISTS saved_items_fts_insert")
+        op.execute("DROP TABLE IF EXISTS saved_items_fts")
+
+    elif dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_saved_items_search")
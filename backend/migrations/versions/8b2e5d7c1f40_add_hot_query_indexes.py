@@ -0,0 +1,44 @@
+"""add hot query indexes
+
+Revision ID: 8b2e5d7c1f40
+Revises: 3f8c1a9d4b27
+Create Date: 2026-10-17 11:40:27.903514
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b2e5d7c1f40'
+down_revision = '3f8c1a9d4b27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('saved_items', schema=None) as batch_op:
+        batch_op.create_index('ix_saved_items_user_type_created', ['user_id', 'content_type', 'created_at'], unique=False)
+        batch_op.create_index('ix_saved_items_user_created', ['user_id', 'created_at', 'id'], unique=False)
+
+    with op.batch_alter_table('shopping_list_items', schema=None) as batch_op:
+        batch_op.create_index('ix_shopping_list_items_user_created', ['user_id', 'created_at'], unique=False)
+
+    # Expression index for the case-insensitive duplicate lookup
+    op.create_index(
+        'ix_shopping_list_items_user_section_name',
+        'shopping_list_items',
+        ['user_id', 'section', sa.text('lower(name)')],
+        unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_shopping_list_items_user_section_name', table_name='shopping_list_items')
+
+    with op.batch_alter_table('shopping_list_items', schema=None) as batch_op:
+        batch_op.drop_index('ix_shopping_list_items_user_created')
+
+    with op.batch_alter_table('saved_items', schema=None) as batch_op:
+        batch_op.drop_index('ix_saved_items_user_created')
+        batch_op.drop_index('ix_saved_items_user_type_created')
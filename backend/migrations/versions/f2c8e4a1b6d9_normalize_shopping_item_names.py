@@ -0,0 +1,33 @@
+"""normalize shopping item names
+
+Revision ID: f2c8e4a1b6d9
+Revises: e7a2c5d8b3f1
+Create Date: 2026-10-17 23:52:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import re
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2c8e4a1b6d9'
+down_revision = 'e7a2c5d8b3f1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Names are now stored trimmed with inner whitespace collapsed, so
+    # lower(name) matches normalize_name(); clean up older rows to match
+    items = sa.table('shopping_list_items', sa.column('id', sa.Integer), sa.column('name', sa.String))
+    conn = op.get_bind()
+    for item_id, name in conn.execute(sa.select(items.c.id, items.c.name)).all():
+        cleaned = re.sub(r'\s+', ' ', (name or '').strip())
+        if cleaned != name:
+            conn.execute(items.update().where(items.c.id == item_id).values(name=cleaned))
+
+
+def downgrade():
+    # Original spacing isn't kept; cleaned names are valid either way
+    pass